@@ -0,0 +1,84 @@
+"""
+Benchmark event dispatch latency of the API loop in a thread and on the GLib main context.
+
+    $ python tools/benchmark_event_loop.py --events 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from threading import Thread
+
+import gi
+
+gi.require_version("GLib", "2.0")
+
+from gi.repository import GLib  # noqa: E402
+
+from twitch_indicator.event_loop import install_glib_event_loop_policy  # noqa: E402
+
+
+async def _round_trips(count: int) -> list[float]:
+    """Measure round trips API loop -> GLib main context -> API loop."""
+    loop = asyncio.get_running_loop()
+    durations: list[float] = []
+    for _ in range(count):
+        fut: asyncio.Future[None] = loop.create_future()
+
+        def on_idle() -> bool:
+            loop.call_soon_threadsafe(fut.set_result, None)
+            return GLib.SOURCE_REMOVE
+
+        start = time.perf_counter()
+        GLib.idle_add(on_idle)
+        await fut
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _benchmark_thread(count: int) -> list[float]:
+    loop = asyncio.new_event_loop()
+    thread = Thread(target=loop.run_forever)
+    thread.start()
+    main_loop = GLib.MainLoop()
+
+    fut = asyncio.run_coroutine_threadsafe(_round_trips(count), loop)
+    fut.add_done_callback(lambda _: GLib.idle_add(main_loop.quit))
+    main_loop.run()
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    return fut.result()
+
+
+def _benchmark_glib(count: int) -> list[float]:
+    """Run benchmark on the GLib main context, policy must be installed."""
+    loop = asyncio.get_event_loop_policy().get_event_loop()
+    try:
+        return loop.run_until_complete(_round_trips(count))
+    finally:
+        loop.close()
+        asyncio.set_event_loop_policy(None)
+
+
+def _print_stats(name: str, durations: list[float]) -> None:
+    ms = sorted(d * 1000 for d in durations)
+    p95 = ms[int(len(ms) * 0.95)]
+    print(f"{name}  mean {statistics.mean(ms):7.3f} ms  p95 {p95:7.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API event loop dispatch latency benchmark")
+    parser.add_argument("--events", type=int, default=1000)
+    args = parser.parse_args()
+    _print_stats("thread:   ", _benchmark_thread(args.events))
+    if install_glib_event_loop_policy():
+        _print_stats("GLib loop:", _benchmark_glib(args.events))
+    else:
+        print("GLib loop:  not available, needs PyGObject >= 3.50")
+
+
+if __name__ == "__main__":
+    main()
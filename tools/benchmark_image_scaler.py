@@ -0,0 +1,71 @@
+"""
+Benchmark profile image scaling in a thread pool and in the image scaler process pool.
+
+    $ python tools/benchmark_image_scaler.py --images 500 --workers 2
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import gi
+
+gi.require_version("GdkPixbuf", "2.0")
+
+from gi.repository import GdkPixbuf  # noqa: E402
+
+from twitch_indicator.api.image_scaler import ImageScaler, scale_image  # noqa: E402
+
+
+def _create_test_image(seed: int) -> bytes:
+    """Create 150x150px JPEG test image."""
+    pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, False, 8, 150, 150)
+    if pixbuf is None:
+        raise RuntimeError("Failed to create pixbuf")
+    pixbuf.fill((seed * 2654435761) & 0xFFFFFF00)
+    res, data = pixbuf.save_to_bufferv("jpeg", [], [])
+    if not res:
+        raise RuntimeError("Failed to create JPEG")
+    return data
+
+
+async def _benchmark_scaler(images: list[bytes], max_workers: int) -> float:
+    scaler = ImageScaler(max_workers)
+    # Start worker processes before measuring
+    await scaler.scale(images[0])
+    start = time.perf_counter()
+    await asyncio.gather(*(scaler.scale(img_data) for img_data in images))
+    duration = time.perf_counter() - start
+    scaler.shutdown()
+    return duration
+
+
+async def _benchmark_executor(images: list[bytes], executor: Executor) -> float:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(executor, scale_image, d) for d in images))
+    return time.perf_counter() - start
+
+
+async def _benchmark(count: int, max_workers: int) -> None:
+    images = [_create_test_image(idx) for idx in range(count)]
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        duration = await _benchmark_executor(images, executor)
+    print(f"thread pool:  {count / duration:8.1f} images/s")
+
+    duration = await _benchmark_scaler(images, max_workers)
+    print(f"process pool: {count / duration:8.1f} images/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile image scaling benchmark")
+    parser.add_argument("--images", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=ImageScaler.MAX_WORKERS)
+    args = parser.parse_args()
+    asyncio.run(_benchmark(args.images, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark parsing of followed live streams pages.
+
+Compares the generic paginated model validating decoded text with the cached
+type adapter validating the raw response bytes:
+
+    $ python tools/benchmark_parsing.py --pages 1000 --page-size 100
+"""
+
+import argparse
+import json
+import timeit
+
+from twitch_indicator.api.models import PaginatedResponse, Stream, get_paginated_adapter
+
+
+def _create_streams_page(size: int) -> bytes:
+    """Create followed streams response page."""
+    streams = [
+        {
+            "id": str(1000 + i),
+            "user_id": str(i),
+            "user_login": f"user{i}",
+            "user_name": f"User{i}",
+            "game_id": "" if i % 10 == 0 else str(500 + i),
+            "game_name": f"Game {i}",
+            "type": "live",
+            "title": f"Stream title number {i}",
+            "viewer_count": i * 7,
+            "started_at": "2024-01-01T12:00:00Z",
+            "language": "en",
+            "thumbnail_url": f"https://example.com/{i}-{{width}}x{{height}}.jpg",
+            "tags": ["English", "Chill"],
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"data": streams, "pagination": {"cursor": "abc"}}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API response parsing benchmark")
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+    data = _create_streams_page(args.page_size)
+
+    def uncached_text() -> None:
+        PaginatedResponse[Stream].model_validate_json(data.decode())
+
+    def cached_bytes() -> None:
+        get_paginated_adapter(Stream).validate_json(data)
+
+    for name, func in (
+        ("generic model, str:", uncached_text),
+        ("cached adapter, bytes:", cached_bytes),
+    ):
+        duration = min(timeit.repeat(func, number=args.pages, repeat=3))
+        print(f"{name:24}{args.pages / duration:8.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Local stand-in for the Twitch EventSub WebSocket server.
+
+Serves the endpoints used by the EventSub push mode so it can be tested offline.
+Subscriptions belong to the WebSocket session they were created for and are
+carried over when the session reconnects:
+
+    $ python tools/eventsub_server.py --port 8080
+    $ TWITCH_INDICATOR_EVENTSUB_WS_URL=ws://127.0.0.1:8080/ws \\
+      TWITCH_INDICATOR_EVENTSUB_API_URL=http://127.0.0.1:8080/ \\
+      twitch-indicator
+
+Trigger events using:
+
+    $ curl -X POST 'http://127.0.0.1:8080/trigger/stream.online?broadcaster_user_id=123'
+    $ curl -X POST 'http://127.0.0.1:8080/trigger/stream.offline?broadcaster_user_id=123'
+    $ curl -X POST 'http://127.0.0.1:8080/reconnect'
+"""
+
+import argparse
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+
+class EventSubServer:
+    """Minimal EventSub WebSocket and subscription endpoint."""
+
+    KEEPALIVE_TIMEOUT = 10
+
+    def __init__(self, max_total_cost: int) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._max_total_cost = max_total_cost
+        self._websockets: dict[str, web.WebSocketResponse] = {}
+        # Session ID -> (type, broadcaster user ID) -> subscription
+        self._subscriptions: dict[str, dict[tuple[str, str], dict[str, Any]]] = {}
+        self._live_streams: dict[int, dict[str, Any]] = {}
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes(
+            (
+                web.get("/ws", self._handle_ws),
+                web.get("/eventsub/subscriptions", self._handle_subscriptions),
+                web.post("/eventsub/subscriptions", self._handle_subscribe),
+                web.get("/streams", self._handle_streams),
+                web.post("/trigger/{sub_type}", self._handle_trigger),
+                web.post("/reconnect", self._handle_reconnect),
+            )
+        )
+        return app
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Send welcome message and keepalives."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        # Reconnect URLs point to the existing session
+        session_id = request.rel_url.query.get("reconnect", "")
+        if session_id in self._subscriptions:
+            self._logger.info("Session reconnected: %s", session_id)
+        else:
+            session_id = str(uuid.uuid4())
+            self._subscriptions[session_id] = {}
+            self._logger.info("Session connected: %s", session_id)
+        self._websockets[session_id] = ws
+
+        session = self._build_session(session_id, self.KEEPALIVE_TIMEOUT)
+        await ws.send_json(self._build_message("session_welcome", {"session": session}))
+
+        try:
+            while not ws.closed:
+                try:
+                    msg = await ws.receive(timeout=self.KEEPALIVE_TIMEOUT - 1)
+                except asyncio.TimeoutError:
+                    await ws.send_json(self._build_message("session_keepalive", {}))
+                    continue
+                if msg.type in (WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.ERROR):
+                    break
+        finally:
+            self._disconnect(session_id, ws)
+
+        return ws
+
+    async def _handle_subscribe(self, request: web.Request) -> web.Response:
+        """Create subscription."""
+        body = await request.json()
+        sub_type = body["type"]
+        user_id = body["condition"]["broadcaster_user_id"]
+        subscriptions = self._subscriptions.get(body["transport"]["session_id"])
+
+        if subscriptions is None:
+            return web.Response(status=400, text="Unknown session\n")
+        if (sub_type, user_id) in subscriptions:
+            return web.Response(status=409)
+        if self._total_cost() >= self._max_total_cost:
+            return web.Response(status=429)
+
+        subscription = {
+            "id": str(uuid.uuid4()),
+            "type": sub_type,
+            "version": body["version"],
+            "status": "enabled",
+            "condition": body["condition"],
+            "cost": 1,
+        }
+        subscriptions[(sub_type, user_id)] = subscription
+        self._logger.info("Subscribed: %s %s", sub_type, user_id)
+
+        data = {
+            "data": [subscription],
+            "total": self._total_cost(),
+            "total_cost": self._total_cost(),
+            "max_total_cost": self._max_total_cost,
+        }
+        return web.json_response(data, status=202)
+
+    async def _handle_subscriptions(self, request: web.Request) -> web.Response:
+        """List subscriptions of all sessions."""
+        data = {
+            "data": [sub for subs in self._subscriptions.values() for sub in subs.values()],
+            "total": self._total_cost(),
+            "total_cost": self._total_cost(),
+            "max_total_cost": self._max_total_cost,
+            "pagination": {},
+        }
+        return web.json_response(data)
+
+    async def _handle_streams(self, request: web.Request) -> web.Response:
+        """Get streams that were triggered online."""
+        user_ids = (int(uid) for uid in request.rel_url.query.getall("user_id", []))
+        data = [self._live_streams[uid] for uid in user_ids if uid in self._live_streams]
+        return web.json_response({"data": data, "pagination": {}})
+
+    async def _handle_trigger(self, request: web.Request) -> web.Response:
+        """Send stream.online/stream.offline notification."""
+        sub_type = request.match_info["sub_type"]
+        user_id = int(request.rel_url.query["broadcaster_user_id"])
+        user_login = request.rel_url.query.get("broadcaster_user_login", f"user{user_id}")
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        event: dict[str, Any] = {
+            "broadcaster_user_id": str(user_id),
+            "broadcaster_user_login": user_login,
+            "broadcaster_user_name": user_login,
+        }
+        if sub_type == "stream.online":
+            stream_id = uuid.uuid4().int % 10**10
+            event.update(id=str(stream_id), type="live", started_at=now)
+            self._live_streams[user_id] = {
+                "id": str(stream_id),
+                "user_id": str(user_id),
+                "user_login": user_login,
+                "user_name": user_login,
+                "game_id": "",
+                "game_name": "",
+                "type": "live",
+                "title": "Stand-in stream",
+                "viewer_count": 0,
+                "started_at": now,
+                "language": "en",
+                "thumbnail_url": "",
+                "tags": [],
+            }
+        elif sub_type == "stream.offline":
+            self._live_streams.pop(user_id, None)
+        else:
+            return web.Response(status=400)
+
+        sent = False
+        for session_id, subscriptions in self._subscriptions.items():
+            subscription = subscriptions.get((sub_type, str(user_id)))
+            ws = self._websockets.get(session_id)
+            if subscription is None or ws is None:
+                continue
+            message = self._build_message(
+                "notification", {"subscription": subscription, "event": event}, sub_type
+            )
+            await ws.send_json(message)
+            sent = True
+
+        if not sent:
+            return web.Response(status=404, text="Not subscribed\n")
+        return web.Response(text="OK\n")
+
+    async def _handle_reconnect(self, request: web.Request) -> web.Response:
+        """Ask connected clients to reconnect."""
+        ws_url = request.url.with_path("/ws").with_scheme("ws")
+        for session_id, ws in list(self._websockets.items()):
+            reconnect_url = str(ws_url.with_query({"reconnect": session_id}))
+            session = self._build_session(session_id, None, reconnect_url)
+            await ws.send_json(self._build_message("session_reconnect", {"session": session}))
+        return web.Response(text="OK\n")
+
+    def _total_cost(self) -> int:
+        """Each subscription costs 1, across all sessions like on Twitch."""
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def _disconnect(self, session_id: str, ws: web.WebSocketResponse) -> None:
+        """Remove session and its subscriptions, unless it was taken over by a reconnect."""
+        if self._websockets.get(session_id) is ws:
+            del self._websockets[session_id]
+            self._subscriptions.pop(session_id, None)
+            self._logger.info("Session disconnected: %s", session_id)
+
+    @staticmethod
+    def _build_session(
+        session_id: str, keepalive_timeout: int | None, reconnect_url: str | None = None
+    ) -> dict[str, Any]:
+        return {
+            "id": session_id,
+            "status": "reconnecting" if reconnect_url else "connected",
+            "keepalive_timeout_seconds": keepalive_timeout,
+            "reconnect_url": reconnect_url,
+            "connected_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    @staticmethod
+    def _build_message(
+        message_type: str, payload: dict[str, Any], subscription_type: str | None = None
+    ) -> dict[str, Any]:
+        metadata = {
+            "message_id": str(uuid.uuid4()),
+            "message_type": message_type,
+            "message_timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        if subscription_type is not None:
+            metadata.update(subscription_type=subscription_type, subscription_version="1")
+        return {"metadata": metadata, "payload": payload}
+
+
+def main() -> None:
+    """Run stand-in server."""
+    parser = argparse.ArgumentParser(description="Twitch EventSub stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-total-cost", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = EventSubServer(args.max_total_cost)
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -53,7 +53,7 @@ class Actions:
         self._logger.debug("_on_open_stream(): %s", param)
 
         user_login = param.get_string()
-        open_cmd = self._app.settings.get_string("open-command")
+        open_cmd = self._app.settings.snapshot.open_command
         url = build_stream_url(user_login)
         browser = webbrowser.get().basename
         formatted = open_cmd.format(url=url, browser=browser).split()
@@ -1,77 +1,160 @@
 import asyncio
 import logging
+import time
+from functools import partial
 from threading import Thread
-from time import sleep
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, Optional
 
 import aiohttp
 from gi.repository import GLib
 
-from twitch_indicator.api.models import ValidationInfo
+from twitch_indicator.api.eventsub import EventSub
+from twitch_indicator.api.exceptions import ApiException
+from twitch_indicator.api.followed_channels import FollowedChannelsSync
+from twitch_indicator.api.image_cache_manager import ImageCacheManager
+from twitch_indicator.api.models import Stream, ValidationInfo
+from twitch_indicator.api.poll_scheduler import PollScheduler
+from twitch_indicator.api.polling import PollStrategy, choose_poll_strategy, targeted_interval
+from twitch_indicator.api.request_scheduler import Priority
+from twitch_indicator.api.task_graph import TaskGraph
 from twitch_indicator.api.twitch_api import TwitchApi
 from twitch_indicator.api.twitch_auth import Auth
-from twitch_indicator.constants import REFRESH_INTERVAL_LIMITS, TWITCH_VALIDATION_INTERVAL
-from twitch_indicator.utils import coro_exception_handler
+from twitch_indicator.constants import (
+    EVENTSUB_RECONCILE_INTERVAL,
+    FOLLOWED_CHANNELS_PATH,
+    FOLLOWED_CHANNELS_REFRESH_INTERVAL,
+    GO_LIVE_STATS_PATH,
+    LIVE_STREAMS_SWEEP_INTERVAL,
+    REFRESH_INTERVAL_LIMITS,
+    TWITCH_VALIDATION_INTERVAL,
+    VALIDATION_RETRY_DELAY,
+)
+from twitch_indicator.state import StateSnapshot
+from twitch_indicator.utils import ImageVariant, coro_exception_handler
 
 if TYPE_CHECKING:
     from twitch_indicator.app import TwitchIndicatorApp
 
 
 class ApiManager:
-    def __init__(self, app: "TwitchIndicatorApp", refresh_interval: float) -> None:
+    def __init__(
+        self,
+        app: "TwitchIndicatorApp",
+        refresh_interval: float,
+        eventsub_enabled: bool,
+        image_download_concurrency: int,
+        image_cache_max_size: int,
+        image_cache_max_entries: int,
+        adaptive_polling: bool,
+        glib_event_loop: bool = False,
+    ) -> None:
         self._logger = logging.getLogger(__name__)
         self.app = app
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[Thread] = None
+        self._glib_event_loop = glib_event_loop
         self._refresh_interval = refresh_interval
+        self._eventsub_enabled = eventsub_enabled
         self._periodic_polling_task: Optional[asyncio.Task[None]] = None
         self._validate_later_task: Optional[asyncio.Task[None]] = None
+        self._eventsub_task: Optional[asyncio.Task[None]] = None
+        self._image_cache_task: Optional[asyncio.Task[None]] = None
+        self._confirm_validation_task: Optional[asyncio.Task[None]] = None
+        self._login_task: Optional[asyncio.Task[None]] = None
+        self._validation_changes = 0
+        self._followed_channels_task: Optional[asyncio.Task[None]] = None
+        self._poll_strategy = PollStrategy.SWEEP
+        self._last_sweep: Optional[float] = None  # Monotonic time
+        self.icon_variant: ImageVariant = "icon"  # Menu icons at the current scale factor
 
         self.auth = Auth()
-        self.api = TwitchApi(self)
+        self.api = TwitchApi(self, image_download_concurrency)
+        self.eventsub = EventSub(self)
+        self.followed_channels = FollowedChannelsSync(self.api, FOLLOWED_CHANNELS_PATH)
+        self.poll_scheduler = PollScheduler(GO_LIVE_STATS_PATH, adaptive_polling)
+        self.image_cache_manager = ImageCacheManager(
+            self, image_cache_max_size, image_cache_max_entries
+        )
 
         self.app.state.add_handler("validation_info", self._on_validation_info_changed)
+        self.app.state.add_handler("enabled_channel_ids", self._on_enabled_channel_ids_changed)
+        self.app.state.add_handler("live_streams_refreshed_at", self._on_live_streams_refreshed)
+        self.app.state.add_handler("live_streams_delta", self._on_live_streams_delta)
 
     def run(self) -> None:
-        """Start asyncio event loop."""
-        self.loop = asyncio.new_event_loop()
+        """Start asyncio event loop, in its own thread or on the GLib main context."""
+        if self._glib_event_loop:
+            # Dispatched by the GLib main loop of the app
+            self.loop = asyncio.get_event_loop_policy().get_event_loop()
+        else:
+            self.loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self.loop.run_forever)
         self.loop.set_exception_handler(self._handle_exception)
         self.api.set_session(aiohttp.ClientSession(loop=self.loop))
-        self._thread = Thread(target=self.loop.run_forever)
-        self._thread.start()
-        fut = asyncio.run_coroutine_threadsafe(self._start(), self.loop)
+        if self._thread is not None:
+            self._thread.start()
+        self.submit(self._start())
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run coroutine on the API loop (callable from any thread)."""
+        if self.loop is None:
+            coro.close()
+            return
+        if self._logger.isEnabledFor(logging.DEBUG):
+            coro = self._log_dispatch_latency(coro, time.perf_counter())
+        fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
         fut.add_done_callback(coro_exception_handler)
 
-    def quit(self) -> None:
-        """Shut down manager."""
+    def quit(self, on_stopped: Callable[[], None]) -> None:
+        """Shut down manager, `on_stopped` is called when all tasks are stopped."""
         self._logger.debug("quit()")
 
-        # Stop API thread event loop
-        if self.loop is not None:
-            fut = asyncio.run_coroutine_threadsafe(self._stop(), self.loop)
-            try:
-                fut.result(timeout=2)
-            except TimeoutError:
-                self._logger.warning("quit(): Not all pending tasks were stopped")
-            except Exception as exc:
-                self._logger.exception("quit(): Exception raised", exc_info=exc)
-            self.loop.call_soon_threadsafe(self.loop.stop)
-            sleep(0.1)
-            self.loop.call_soon_threadsafe(self.loop.close)
-            self._logger.debug("quit(): API thread event loop closed")
-
-        # Stop API thread
-        if self._thread is not None:
-            self._thread.join(timeout=2)
-            if self._thread.is_alive():
-                raise RuntimeError("Could not shut down API thread")
-            self._logger.debug("quit(): API thread shut down")
+        if self.loop is None:
+            on_stopped()
+        elif self._thread is None:
+            self._quit_glib_event_loop(self.loop, on_stopped)
+        else:
+            self._quit_thread(self.loop, self._thread)
+            on_stopped()
+
+    def _quit_glib_event_loop(
+        self, loop: asyncio.AbstractEventLoop, on_stopped: Callable[[], None]
+    ) -> None:
+        """Stop tasks without blocking the shared main loop."""
+        if loop.is_running():
+            task = loop.create_task(self._stop())
+            task.add_done_callback(lambda _: on_stopped())
+        else:
+            loop.run_until_complete(self._stop())
+            on_stopped()
+
+    def _quit_thread(self, loop: asyncio.AbstractEventLoop, thread: Thread) -> None:
+        """Stop tasks, then the API thread event loop."""
+        fut = asyncio.run_coroutine_threadsafe(self._stop(), loop)
+        try:
+            fut.result(timeout=2)
+        except TimeoutError:
+            self._logger.warning("quit(): Not all pending tasks were stopped")
+        except Exception as exc:
+            self._logger.exception("quit(): Exception raised", exc_info=exc)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2)
+        if thread.is_alive():
+            raise RuntimeError("Could not shut down API thread")
+        loop.close()
+        self._logger.debug("quit(): API thread shut down")
 
     async def login(self, auth_event: Optional[asyncio.Event]) -> None:
         """Start auth flow."""
         await self.auth.acquire_token(auth_event)
         await self.validate()
 
+    async def logout(self, forget_user: bool) -> None:
+        """Remove auth token, forget what was learned about the user if requested."""
+        await self.auth.logout()
+        if forget_user:
+            await self.poll_scheduler.clear()
+
     async def acquire_token(self, auth_event: Optional[asyncio.Event]) -> None:
         """Acquire auth token."""
         await self.auth.acquire_token(auth_event)
@@ -83,17 +166,101 @@ class ApiManager:
         if self.loop is not None and self._refresh_interval != old_refresh_interval:
             self.loop.create_task(self._restart_periodic_polling())
 
+    def update_adaptive_polling(self, adaptive_polling: bool) -> None:
+        self._logger.debug("update_adaptive_polling(): %s", adaptive_polling)
+        self.poll_scheduler.adaptive = adaptive_polling
+
+    def update_eventsub_enabled(self, eventsub_enabled: bool) -> None:
+        self._logger.debug("update_eventsub_enabled(): %s", eventsub_enabled)
+        old_eventsub_enabled = self._eventsub_enabled
+        self._eventsub_enabled = eventsub_enabled
+        if self.loop is not None and self._eventsub_enabled != old_eventsub_enabled:
+            self.loop.create_task(self._restart_eventsub())
+
+    async def prefetch_profile_images(
+        self, user_ids: Iterable[int], variants: Iterable[ImageVariant]
+    ) -> None:
+        """Decode profile images before the GUI needs them."""
+        loop = asyncio.get_running_loop()
+        func = partial(self.app.pixbuf_cache.prefetch, list(user_ids), tuple(variants))
+        await loop.run_in_executor(None, func)
+
+    async def prefetch_stream_images(self, user_ids: Iterable[int]) -> None:
+        """
+        Decode menu icons of live streams.
+
+        Only the icon variant of the current scale factor is decoded, the large
+        variant only for channels with notifications to keep the cache small.
+        """
+        user_ids = list(user_ids)
+        await self.prefetch_profile_images(user_ids, (self.icon_variant,))
+        if self.app.settings.snapshot.enable_notifications:
+            enabled_ids = self.app.state.snapshot.enabled_ids
+            notify_ids = [user_id for user_id in user_ids if user_id in enabled_ids]
+            if notify_ids:
+                await self.prefetch_profile_images(notify_ids, ("regular",))
+
     async def validate(self) -> None:
         """Validate API token."""
+        validation_info, validated_at = await self._fetch_validation()
+        with self.app.state.transaction() as txn:
+            txn.set_validation_info(validation_info, validated_at)
+
+    async def _fetch_validation(self) -> tuple[ValidationInfo, float]:
+        """Validate API token and remember result for the next start."""
         validation_info = await self.api.validate()
-        self._logger.debug("validate(): Validated: %d", validation_info.user_id)
-        GLib.idle_add(self.app.state.set_validation_info, validation_info)
+        validated_at = time.time()
+        self._logger.debug("_fetch_validation(): Validated: %d", validation_info.user_id)
+        await self.auth.store_validation(validation_info, validated_at)
+        return validation_info, validated_at
 
     async def _start(self) -> None:
         """API thread main coroutine."""
         self._logger.debug("_start()")
         await self.auth.restore_token()
-        await self.validate()
+        await self.poll_scheduler.load()
+        self._image_cache_task = asyncio.create_task(self.image_cache_manager.run())
+
+        cached = await self.auth.restore_validation()
+        if cached is None:
+            await self._validate_until_success()
+            return
+
+        # Trust recent validation, confirm it off the critical path
+        validation_info, validated_at = cached
+        self._logger.debug("_start(): Using validation from %.0fs ago", time.time() - validated_at)
+        with self.app.state.transaction() as txn:
+            txn.set_validation_info(validation_info, validated_at)
+        self._confirm_validation_task = asyncio.create_task(self._confirm_validation())
+
+    async def _confirm_validation(self) -> None:
+        """Validate token in the background after trusting a cached validation."""
+        try:
+            validation_info, validated_at = await self._fetch_validation()
+        except ApiException as exc:
+            # Periodic validation will retry
+            self._logger.warning("_confirm_validation(): Validation failed: %s", exc)
+            return
+
+        # Only restart the login flow if validation changed (e.g. after re-authentication)
+        current = self.app.state.snapshot.validation_info
+        if current is None or (current.user_id, current.scopes) != (
+            validation_info.user_id,
+            validation_info.scopes,
+        ):
+            with self.app.state.transaction() as txn:
+                txn.set_validation_info(validation_info, validated_at)
+
+    async def _validate_until_success(self) -> None:
+        """Validate token, retry while the API is unavailable."""
+        while True:
+            try:
+                await self.validate()
+                return
+            except ApiException as exc:
+                msg = "_validate_until_success(): Validation failed (%s), retrying in %ds"
+                self._logger.warning(msg, exc, VALIDATION_RETRY_DELAY)
+                await asyncio.sleep(VALIDATION_RETRY_DELAY)
 
     async def _stop(self) -> None:
         """Stop pending tasks and thread."""
@@ -102,17 +269,32 @@ class ApiManager:
         # Close client session
         await self.api.close_session()
 
+        # Stop image scaling processes
+        self.api.image_scaler.shutdown()
+
         # Cancel and gather remaining tasks
         tasks = [t for t in asyncio.all_tasks() if t != asyncio.current_task()]
         [task.cancel() for task in tasks]
         await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _on_validation_info_changed(self, validation_info: ValidationInfo) -> None:
+    async def _on_validation_info_changed(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
         """Continue request flow after successful validation."""
         self._logger.debug("_on_validation_info_changed()")
 
         if self.loop is None:
             raise RuntimeError("No event loop")
+        self._validation_changes += 1
+        validation_change = self._validation_changes
+
+        # Cancel login of a previous validation, it would restart tasks cancelled below
+        if self._login_task is not None and not self._login_task.done():
+            self._login_task.cancel()
+            try:
+                await self._login_task
+            except asyncio.CancelledError:
+                pass
 
         # Cancel validation later task
         if self._validate_later_task is not None:
@@ -130,34 +312,73 @@ class ApiManager:
             except asyncio.CancelledError:
                 pass
 
-        with self.app.state.locks["validation_info"]:
-            # Nothing to do if validation failed
-            if validation_info is None:
-                return
-            user_id = validation_info.user_id
+        # Cancel periodic followed channels refresh
+        if self._followed_channels_task is not None:
+            self._followed_channels_task.cancel()
+            try:
+                await self._followed_channels_task
+            except asyncio.CancelledError:
+                pass
 
-        # Get logged in user info
-        (user,) = await self.api.fetch_users([user_id])
-        self._logger.debug("run(): Got logged in user: %d", user.id)
-        GLib.idle_add(self.app.state.set_user, user)
+        # Cancel EventSub session
+        await self._stop_eventsub()
 
-        # Ensure user profile pic
-        await self.api.fetch_profile_pictures((user_id,))
+        # Nothing to do if validation failed, forget followed channels after logout
+        if new.validation_info is None:
+            if old.validation_info is not None:
+                await self.followed_channels.clear()
+            return
+        self.poll_scheduler.set_user(new.validation_info.user_id)
+
+        # A newer validation arrived while stopping tasks, its handler takes over
+        if validation_change != self._validation_changes:
+            return
 
-        # Get followed channels
-        await self._refresh_followed_channels(user_id)
+        self._login_task = self.loop.create_task(self._login(new.validation_info.user_id))
+        try:
+            await self._login_task
+        except asyncio.CancelledError:
+            # Superseded by a newer validation
+            pass
 
-        # Get followed live streams
-        await self._refresh_live_streams()
+    async def _login(self, user_id: int) -> None:
+        """Fetch user data and start periodic tasks after validation."""
+        if self.loop is None:
+            raise RuntimeError("No event loop")
 
-        # Start stream polling cycle
-        await self._restart_periodic_polling()
+        # Independent fetches run concurrently, each result is published when ready
+        graph = TaskGraph("login")
+        graph.add("user", partial(self._refresh_user, user_id))
+        graph.add("user_image", partial(self._refresh_user_image, user_id))
+        graph.add("followed_channels", partial(self._refresh_followed_channels, user_id))
+        graph.add("live_streams", self._refresh_live_streams)
+        # Leave the request budget to the initial fetches
+        graph.add("polling", self._restart_periodic_polling, ("live_streams",))
+        graph.add("eventsub", self._restart_eventsub, ("live_streams",))
+        await graph.run()
 
         # Start next periodic token validation
         self._validate_later_task = self.loop.create_task(self._validate_later())
 
+        # Pick up new follows without logging in again
+        coro = self._periodic_followed_channels_refresh(user_id)
+        self._followed_channels_task = self.loop.create_task(coro)
+
         # Allow notifications to happen from this point on
-        GLib.idle_add(self.app.state.set_first_run, False)
+        with self.app.state.transaction() as txn:
+            txn.set_first_run(False)
+
+    async def _refresh_user(self, user_id: int) -> None:
+        """Get logged in user info."""
+        (user,) = await self.api.fetch_users([user_id], Priority.INTERACTIVE)
+        self._logger.debug("_refresh_user(): Got logged in user: %d", user.id)
+        with self.app.state.transaction() as txn:
+            txn.set_user(user)
+
+    async def _refresh_user_image(self, user_id: int) -> None:
+        """Ensure logged in user profile pic."""
+        await self.api.fetch_profile_pictures((user_id,))
+        await self.prefetch_profile_images((user_id,), ("icon",))
 
     async def _restart_periodic_polling(self) -> None:
         """(Re)start periodic polling."""
@@ -176,39 +397,204 @@ class ApiManager:
             self._periodic_polling_task = self.loop.create_task(coro)
 
     async def _periodic_polling(self) -> None:
-        """Poll followed live streams periodically."""
+        """Poll followed live streams, scheduled by monotonic deadlines."""
+        deadline = time.monotonic()
+        while True:
+            # The fetch duration doesn't delay the next poll, missed polls are skipped
+            interval = self._polling_delay()
+            strategy = self._update_poll_strategy(interval)
+            if strategy == PollStrategy.TARGETED:
+                interval = targeted_interval(interval)
+            deadline = max(deadline + interval, time.monotonic())
+            await asyncio.sleep(deadline - time.monotonic())
+
+            sent = self.api.scheduler.sent[Priority.POLL]
+            try:
+                await self._poll_live_streams(strategy)
+            except ApiException as exc:
+                self._logger.warning("_periodic_polling(): Refresh failed: %s", exc)
+            self.poll_scheduler.record_poll_requests(self.api.scheduler.sent[Priority.POLL] - sent)
 
-        RI_MIN = int(REFRESH_INTERVAL_LIMITS[0] * 60)
-        RI_MAX = int(REFRESH_INTERVAL_LIMITS[1] * 60)
-        delay = max(min(int(self._refresh_interval * 60), RI_MAX), RI_MIN)
+            stats = self.poll_scheduler.stats(interval)
+            self._logger.debug("_periodic_polling(): %s", stats)
+            with self.app.state.transaction() as txn:
+                txn.set_polling_stats(stats)
 
-        while True:
-            await asyncio.sleep(delay)
+    def _update_poll_strategy(self, interval: float) -> PollStrategy:
+        """
+        Choose between sweeping all followed live streams and targeted lookups.
+
+        Targeted lookups cost one request per 100 enabled channels, a sweep one
+        per 100 live streams. When targeted polling is cheaper, enabled channels
+        are looked up faster than the refresh interval and the sweep for the
+        menu only runs every `LIVE_STREAMS_SWEEP_INTERVAL`.
+        """
+        snapshot = self.app.state.snapshot
+        enabled_ids = self._pollable_enabled_ids(snapshot)
+        strategy = choose_poll_strategy(
+            len(snapshot.live_streams), len(enabled_ids), interval, LIVE_STREAMS_SWEEP_INTERVAL
+        )
+        if strategy != self._poll_strategy:
+            msg = "_update_poll_strategy(): Switching to %s polling (%d live, %d enabled)"
+            self._logger.info(msg, strategy, len(snapshot.live_streams), len(enabled_ids))
+            self._poll_strategy = strategy
+        return strategy
+
+    @staticmethod
+    def _pollable_enabled_ids(snapshot: StateSnapshot) -> frozenset[int]:
+        """Enabled channels that are still followed."""
+        followed_ids = {c.broadcaster_id for c in snapshot.followed_channels}
+        return snapshot.enabled_ids & followed_ids
+
+    async def _poll_live_streams(self, strategy: PollStrategy) -> None:
+        """Poll live streams using the given strategy, sweep when due."""
+        enabled_ids = self._pollable_enabled_ids(self.app.state.snapshot)
+        sweep_due = (
+            self._last_sweep is None
+            or time.monotonic() - self._last_sweep >= LIVE_STREAMS_SWEEP_INTERVAL
+        )
+        if strategy == PollStrategy.SWEEP or sweep_due:
             await self._refresh_live_streams()
+        elif enabled_ids:
+            await self._refresh_enabled_streams(enabled_ids)
+
+    async def _refresh_enabled_streams(self, user_ids: frozenset[int]) -> None:
+        """Refresh live streams of the given channels only."""
+        live_streams = await self.api.fetch_streams_batched(user_ids)
+
+        msg = "_refresh_enabled_streams(): live streams: %d of %d"
+        self._logger.debug(msg, len(live_streams), len(user_ids))
+
+        offline_ids = user_ids - {s.user_id for s in live_streams}
+        await self._publish_live_streams_page(live_streams, offline_ids)
+
+    def _polling_delay(self) -> float:
+        """
+        Get delay until next poll.
+
+        The refresh interval is adapted to the usual go-live times of enabled
+        channels. Polling slows down to a reconciliation interval when all
+        enabled channels are covered by push events.
+        """
+        RI_MIN = REFRESH_INTERVAL_LIMITS[0] * 60
+        RI_MAX = REFRESH_INTERVAL_LIMITS[1] * 60
+        delay = max(min(self._refresh_interval * 60, RI_MAX), RI_MIN)
+        delay = self.poll_scheduler.adapt_interval(delay, (RI_MIN, RI_MAX))
+
+        subscribed_ids = self.eventsub.subscribed_user_ids
+        if subscribed_ids and self.app.state.snapshot.enabled_ids <= subscribed_ids:
+            delay = max(delay, EVENTSUB_RECONCILE_INTERVAL)
+
+        return delay
+
+    async def _restart_eventsub(self) -> None:
+        """(Re)start EventSub session for enabled channels."""
+        self._logger.debug("_restart_eventsub()")
+
+        await self._stop_eventsub()
+
+        snapshot = self.app.state.snapshot
+        logged_in = snapshot.validation_info is not None
+        enabled_ids = snapshot.enabled_ids
+
+        if self.loop is not None and self._eventsub_enabled and logged_in and enabled_ids:
+            coro = self.eventsub.run(enabled_ids)
+            self._eventsub_task = self.loop.create_task(coro)
+
+    async def _stop_eventsub(self) -> None:
+        """Cancel EventSub session."""
+        if self._eventsub_task is not None and not self._eventsub_task.done():
+            self._eventsub_task.cancel()
+            try:
+                await self._eventsub_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _on_live_streams_refreshed(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
+        """Store state for the next start after each poll."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.app.warm_start.save, new)
+
+    async def _on_live_streams_delta(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
+        """Learn when enabled channels go live."""
+        if old.first_run or new.first_run:
+            return
+        enabled_ids = new.enabled_ids
+        went_live = [s for s in new.live_streams_delta.went_live if s.user_id in enabled_ids]
+        if self.poll_scheduler.record_go_live(went_live, time.time()):
+            await self.poll_scheduler.save()
+
+    async def _on_enabled_channel_ids_changed(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
+        """Subscribe to live events for changed channels."""
+        if self._eventsub_enabled and new.validation_info is not None:
+            await self._restart_eventsub()
 
     async def _refresh_live_streams(self) -> None:
         """Refresh followed live streams."""
-        with self.app.state.locks["validation_info"]:
-            if self.app.state.validation_info is None:
-                self._logger.warning("_refresh_live_streams(): No user info set")
-                return
-            user_id = self.app.state.validation_info.user_id
+        validation_info = self.app.state.snapshot.validation_info
+        if validation_info is None:
+            self._logger.warning("_refresh_live_streams(): No user info set")
+            return
+        user_id = validation_info.user_id
+
+        started = time.monotonic()
+        live_streams: list[Stream] = []
+        page_tasks: list[asyncio.Task[None]] = []
+        async for page in self.api.iter_followed_streams(user_id):
+            live_streams += page
+            # Start on profile pictures before the last page arrives
+            page_tasks.append(asyncio.create_task(self._publish_live_streams_page(page)))
+        await asyncio.gather(*page_tasks)
 
-        live_streams = await self.api.fetch_followed_streams(user_id)
         msg = "_refresh_live_streams(): live streams: %d"
         self._logger.debug(msg, len(live_streams))
 
-        # Ensure current profile pictures
-        await self.api.fetch_profile_pictures(s.user_id for s in live_streams)
+        # Send complete live streams to GUI (drops streams that went offline)
+        with self.app.state.transaction() as txn:
+            txn.set_live_streams(live_streams)
+        self._last_sweep = started
 
-        # Send live streams to GUI
-        GLib.idle_add(self.app.state.set_live_streams, live_streams)
+    async def _publish_live_streams_page(
+        self, page: list[Stream], offline_ids: Iterable[int] = ()
+    ) -> None:
+        """Ensure profile pictures and add page of live streams to GUI."""
+        try:
+            await self.api.fetch_profile_pictures(s.user_id for s in page)
+        except ApiException as exc:
+            self._logger.warning("_publish_live_streams_page(): No profile pictures: %s", exc)
+        await self.prefetch_stream_images(s.user_id for s in page)
+        with self.app.state.transaction() as txn:
+            txn.patch_live_streams(page, offline_ids)
 
     async def _refresh_followed_channels(self, user_id: int) -> None:
-        """Refresh followed channels list."""
+        """Show cached followed channels, then fetch new follows."""
         self._logger.debug("refresh_followed_channels()")
-        followed_channels = await self.api.fetch_followed_channels(user_id)
-        GLib.idle_add(self.app.state.set_followed_channels, followed_channels)
+        cached = await self.followed_channels.load(user_id)
+        if cached is not None and tuple(cached) != self.app.state.snapshot.followed_channels:
+            with self.app.state.transaction() as txn:
+                txn.set_followed_channels(cached)
+
+        followed_channels = await self.followed_channels.sync(user_id)
+        with self.app.state.transaction() as txn:
+            txn.set_followed_channels(followed_channels)
+
+    async def _periodic_followed_channels_refresh(self, user_id: int) -> None:
+        """Refresh followed channels periodically."""
+        while True:
+            await asyncio.sleep(FOLLOWED_CHANNELS_REFRESH_INTERVAL)
+            try:
+                followed_channels = await self.followed_channels.sync(user_id)
+            except ApiException as exc:
+                self._logger.warning("_periodic_followed_channels_refresh(): Failed: %s", exc)
+                continue
+            with self.app.state.transaction() as txn:
+                txn.set_followed_channels(followed_channels)
 
     async def _validate_later(self) -> None:
         """
@@ -217,7 +603,13 @@ class ApiManager:
         https://dev.twitch.tv/docs/authentication/validate-tokens/
         """
         await asyncio.sleep(TWITCH_VALIDATION_INTERVAL)
-        await self.validate()
+        await self._validate_until_success()
+
+    async def _log_dispatch_latency(self, coro: Coroutine[Any, Any, Any], submitted: float) -> Any:
+        latency = (time.perf_counter() - submitted) * 1000
+        name = getattr(coro, "__qualname__", coro)
+        self._logger.debug("submit(): %s dispatched after %.3fms", name, latency)
+        return await coro
 
     def _handle_exception(self, loop: asyncio.AbstractEventLoop, context: dict[str, Any]):
         """Handle exceptions created by create_task."""
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import aiohttp
+from pydantic import ValidationError
+
+from twitch_indicator.api.exceptions import (
+    ApiException,
+    ConflictException,
+    RateLimitExceededException,
+)
+from twitch_indicator.api.models import (
+    EventSubMessage,
+    EventSubSession,
+    Stream,
+    StreamOfflineEvent,
+    StreamOnlineEvent,
+)
+from twitch_indicator.constants import TWITCH_EVENTSUB_API_URL, TWITCH_EVENTSUB_WS_URL
+
+if TYPE_CHECKING:
+    from twitch_indicator.api.api_manager import ApiManager
+
+
+class EventSub:
+    """
+    Receive stream online/offline events over an EventSub WebSocket session.
+
+    https://dev.twitch.tv/docs/eventsub/handling-websocket-events/
+    """
+
+    RECONNECT_DELAY_MIN = 1
+    RECONNECT_DELAY_MAX = 300
+    KEEPALIVE_GRACE = 5
+    STREAM_LOOKUP_ATTEMPTS = 3
+    STREAM_LOOKUP_DELAY = 5
+    SUBSCRIPTION_TYPES = ("stream.online", "stream.offline")
+
+    def __init__(self, api_manager: "ApiManager") -> None:
+        self._logger = logging.getLogger(__name__)
+        self._api_manager = api_manager
+        self._subscribed_user_ids: set[int] = set()
+        self._message_ids: deque[str] = deque(maxlen=100)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def subscribed_user_ids(self) -> frozenset[int]:
+        """User IDs currently covered by push events."""
+        return frozenset(self._subscribed_user_ids)
+
+    async def run(self, user_ids: Iterable[int]) -> None:
+        """Keep an EventSub session alive and reconnect on failure."""
+        user_ids = list(user_ids)
+        delay = self.RECONNECT_DELAY_MIN
+
+        while True:
+            try:
+                await self._run_session(user_ids)
+                delay = self.RECONNECT_DELAY_MIN
+            except (aiohttp.ClientError, TimeoutError, ConnectionError, ApiException) as exc:
+                msg = "run(): EventSub connection lost (%s), reconnecting in %ds"
+                self._logger.warning(msg, exc, delay)
+            finally:
+                self._subscribed_user_ids.clear()
+                for task in self._tasks:
+                    task.cancel()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_DELAY_MAX)
+
+    async def _run_session(self, user_ids: list[int]) -> None:
+        """Receive messages until the connection is closed."""
+        ws = await self._api_manager.api.ws_connect(TWITCH_EVENTSUB_WS_URL)
+        keepalive_timeout: Optional[int] = None
+
+        try:
+            while True:
+                timeout = None
+                if keepalive_timeout is not None:
+                    timeout = keepalive_timeout + self.KEEPALIVE_GRACE
+                ws_msg = await ws.receive(timeout=timeout)
+                if ws_msg.type != aiohttp.WSMsgType.TEXT:
+                    raise ConnectionError(f"WebSocket closed: {ws_msg.type!r}")
+
+                try:
+                    message = EventSubMessage.model_validate_json(ws_msg.data)
+                except ValidationError as exc:
+                    # Unknown message type or schema change, don't lose the session
+                    self._logger.warning("_run_session(): Skipping invalid message: %s", exc)
+                    continue
+                metadata = message.metadata
+                if metadata.message_id in self._message_ids:
+                    continue
+                self._message_ids.append(metadata.message_id)
+
+                session = message.payload.session
+                if metadata.message_type == "session_welcome" and session is not None:
+                    self._logger.debug("_run_session(): Welcome session_id=%s", session.id)
+                    keepalive_timeout = session.keepalive_timeout_seconds
+                    # Subscriptions are carried over on reconnect
+                    if not self._subscribed_user_ids:
+                        await self._subscribe(session, user_ids)
+                elif metadata.message_type == "session_reconnect" and session is not None:
+                    # Connect to new URL before closing the old connection
+                    if session.reconnect_url is None:
+                        raise ConnectionError("No reconnect URL received")
+                    self._logger.debug("_run_session(): Reconnect to %s", session.reconnect_url)
+                    new_ws = await self._api_manager.api.ws_connect(session.reconnect_url)
+                    await ws.close()
+                    ws = new_ws
+                elif metadata.message_type == "notification":
+                    try:
+                        self._handle_notification(message)
+                    except ValidationError as exc:
+                        self._logger.warning("_run_session(): Skipping invalid event: %s", exc)
+                elif metadata.message_type == "revocation":
+                    subscription = message.payload.subscription
+                    if subscription is not None:
+                        user_id = int(subscription.condition["broadcaster_user_id"])
+                        self._subscribed_user_ids.discard(user_id)
+                        msg = "_run_session(): Subscription revoked: %d (%s)"
+                        self._logger.info(msg, user_id, subscription.status)
+        finally:
+            await ws.close()
+
+    async def _subscribe(self, session: EventSubSession, user_ids: list[int]) -> None:
+        """Subscribe to stream.online/stream.offline until the cost limit is reached."""
+        api = self._api_manager.api
+        total_cost, max_total_cost = await api.fetch_eventsub_cost(TWITCH_EVENTSUB_API_URL)
+        limit_reached = False
+        for user_id in user_ids:
+            # A channel needs both subscriptions, don't leave a lone online subscription
+            if max_total_cost - total_cost < len(self.SUBSCRIPTION_TYPES):
+                limit_reached = True
+                break
+
+            condition = {"broadcaster_user_id": str(user_id)}
+            for sub_type in self.SUBSCRIPTION_TYPES:
+                try:
+                    _, total_cost, max_total_cost = await api.create_eventsub_subscription(
+                        sub_type, condition, session.id, api_url=TWITCH_EVENTSUB_API_URL
+                    )
+                except ConflictException:
+                    pass
+                except RateLimitExceededException:
+                    # Cost used up by another session meanwhile
+                    limit_reached = True
+                    break
+            else:
+                self._subscribed_user_ids.add(user_id)
+
+            if limit_reached:
+                break
+
+        if limit_reached:
+            self._logger.info("_subscribe(): Subscription cost limit reached")
+        msg = "_subscribe(): Push events for %d/%d channels"
+        self._logger.info(msg, len(self._subscribed_user_ids), len(user_ids))
+
+    def _handle_notification(self, message: EventSubMessage) -> None:
+        """Apply stream.online/stream.offline event."""
+        sub_type = message.metadata.subscription_type
+        event = message.payload.event
+        if event is None:
+            return
+
+        if sub_type == "stream.online":
+            online_event = StreamOnlineEvent.model_validate(event)
+            user_id = online_event.broadcaster_user_id
+            self._logger.debug("_handle_notification(): Online: %d", user_id)
+            task = asyncio.create_task(self._add_stream(user_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_task_done)
+        elif sub_type == "stream.offline":
+            offline_event = StreamOfflineEvent.model_validate(event)
+            user_id = offline_event.broadcaster_user_id
+            self._logger.debug("_handle_notification(): Offline: %d", user_id)
+            with self._api_manager.app.state.transaction() as txn:
+                txn.patch_live_streams([], [user_id])
+
+    async def _add_stream(self, user_id: int) -> None:
+        """Look up stream that just went live and add it to live streams."""
+        api = self._api_manager.api
+
+        # Stream info might not be available right away
+        streams: list[Stream] = []
+        try:
+            for _ in range(self.STREAM_LOOKUP_ATTEMPTS):
+                streams = await api.fetch_streams([user_id], api_url=TWITCH_EVENTSUB_API_URL)
+                if streams:
+                    break
+                await asyncio.sleep(self.STREAM_LOOKUP_DELAY)
+            else:
+                self._logger.warning("_add_stream(): No stream info for %d", user_id)
+                return
+        except ApiException as exc:
+            # Polling will catch up
+            self._logger.warning("_add_stream(): Lookup failed for %d: %s", user_id, exc)
+            return
+
+        try:
+            await api.fetch_profile_pictures(s.user_id for s in streams)
+            await self._api_manager.prefetch_stream_images((user_id,))
+        except (ApiException, OSError) as exc:
+            # Show stream with the fallback image
+            self._logger.warning("_add_stream(): No profile picture for %d: %s", user_id, exc)
+
+        with self._api_manager.app.state.transaction() as txn:
+            txn.patch_live_streams(streams, [])
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        """Log errors of event tasks, they must not reach the loop exception handler."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error("_on_task_done(): Event task failed", exc_info=task.exception())
@@ -8,3 +8,19 @@ class NotAuthorizedException(ApiException):
 
 class RateLimitExceededException(ApiException):
     """Exception raised when the rate limit is exceeded (HTTP 429)."""
+
+
+class ConflictException(ApiException):
+    """Exception raised when the resource already exists (HTTP 409)."""
+
+
+class ServerErrorException(ApiException):
+    """Exception raised when the server fails to respond (HTTP 5xx or timeout)."""
+
+
+class InvalidResponseException(ApiException):
+    """Exception raised when the response body can't be parsed."""
+
+
+class CircuitOpenException(ApiException):
+    """Exception raised when requests are suspended after repeated failures."""
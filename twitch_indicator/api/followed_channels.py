@@ -0,0 +1,134 @@
+import logging
+import time
+from contextlib import aclosing
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+import aiofiles
+import aiofiles.os
+from pydantic import BaseModel, ValidationError
+
+from twitch_indicator.api.models import FollowedChannel
+from twitch_indicator.constants import FOLLOWED_CHANNELS_FULL_SYNC_INTERVAL
+
+if TYPE_CHECKING:
+    from twitch_indicator.api.twitch_api import TwitchApi
+
+
+class CachedFollowedChannels(BaseModel):
+    """Followed channels of a user, newest follow first."""
+
+    user_id: int
+    full_sync_at: float  # Unix timestamp of last complete pagination
+    channels: list[FollowedChannel]
+
+
+class FollowedChannelsSync:
+    """
+    Keep followed channels in sync with an on-disk cache.
+
+    Twitch lists followed channels newest first, so a sync only paginates until
+    it reaches a known follow. Unfollows are only seen by a full sync, which
+    runs every `FOLLOWED_CHANNELS_FULL_SYNC_INTERVAL`.
+    """
+
+    def __init__(self, api: "TwitchApi", path: str) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._api = api
+        self._path = path
+        self._cached: Optional[CachedFollowedChannels] = None
+
+    async def load(self, user_id: int) -> Optional[list[FollowedChannel]]:
+        """Load cached followed channels of user."""
+        if self._cached is None or self._cached.user_id != user_id:
+            self._cached = await self._read()
+        if self._cached is None or self._cached.user_id != user_id:
+            return None
+        return list(self._cached.channels)
+
+    async def sync(self, user_id: int) -> list[FollowedChannel]:
+        """Fetch changes since the last sync, returns all followed channels."""
+        cached = self._cached if await self.load(user_id) is not None else None
+
+        if (
+            cached is None
+            or time.time() - cached.full_sync_at >= FOLLOWED_CHANNELS_FULL_SYNC_INTERVAL
+        ):
+            channels = await self._fetch(user_id, None)
+            full_sync_at = time.time()
+        else:
+            known = {(c.broadcaster_id, c.followed_at) for c in cached.channels}
+            channels = await self._fetch(user_id, known)
+            if channels and (channels[-1].broadcaster_id, channels[-1].followed_at) in known:
+                channels = channels[:-1] + cached.channels
+                full_sync_at = cached.full_sync_at
+            else:
+                # Paginated to the end without reaching a known follow
+                full_sync_at = time.time()
+
+        # Keep newest follow of each channel (refollows, entries moving between pages)
+        channels_by_id: dict[int, FollowedChannel] = {}
+        for channel in channels:
+            channels_by_id.setdefault(channel.broadcaster_id, channel)
+        channels = list(channels_by_id.values())
+
+        self._cached = CachedFollowedChannels(
+            user_id=user_id, full_sync_at=full_sync_at, channels=channels
+        )
+        await self._write(self._cached)
+        return channels
+
+    async def clear(self) -> None:
+        """Remove cache, e.g. after logout."""
+        self._cached = None
+        try:
+            await aiofiles.os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            self._logger.warning("clear(): Failed to remove cache: %s", exc)
+
+    async def _fetch(
+        self, user_id: int, known: Optional[set[tuple[int, datetime]]]
+    ) -> list[FollowedChannel]:
+        """
+        Paginate followed channels, stop at the first known follow.
+
+        The first known follow is included in the result.
+        """
+        channels: list[FollowedChannel] = []
+        pages = 0
+        async with aclosing(self._api.iter_followed_channels(user_id)) as it:
+            async for page in it:
+                pages += 1
+                for channel in page:
+                    channels.append(channel)
+                    key = (channel.broadcaster_id, channel.followed_at)
+                    if known is not None and key in known:
+                        self._logger.debug(
+                            "_fetch(): Reached known follow after %d pages, %d new",
+                            pages,
+                            len(channels) - 1,
+                        )
+                        return channels
+        self._logger.debug("_fetch(): Paginated all %d pages, %d channels", pages, len(channels))
+        return channels
+
+    async def _read(self) -> Optional[CachedFollowedChannels]:
+        try:
+            async with aiofiles.open(self._path, "r", encoding="UTF-8") as f:
+                return CachedFollowedChannels.model_validate_json(await f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as exc:
+            self._logger.warning("_read(): Ignoring invalid cache: %s", exc)
+            return None
+
+    async def _write(self, cached: CachedFollowedChannels) -> None:
+        tmp_path = f"{self._path}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "w", encoding="UTF-8") as f:
+                await f.write(cached.model_dump_json())
+            await aiofiles.os.replace(tmp_path, self._path)
+        except OSError as exc:
+            self._logger.warning("_write(): Failed to store cache: %s", exc)
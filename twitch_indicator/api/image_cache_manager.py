@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from twitch_indicator.constants import IMAGE_CACHE_SWEEP_DELAY, IMAGE_CACHE_SWEEP_INTERVAL
+
+if TYPE_CHECKING:
+    from twitch_indicator.api.api_manager import ApiManager
+
+
+class ImageCacheManager:
+    """
+    Keep the profile image store within its size and entry budget.
+
+    Least recently shown images are evicted first. Images of followed channels and
+    of the logged in user are always kept. Sweeps run on the API loop, the store is
+    accessed in the executor.
+    """
+
+    def __init__(self, api_manager: "ApiManager", max_size_mib: int, max_entries: int) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._api_manager = api_manager
+        self._max_bytes = max_size_mib * 1024 * 1024
+        self._max_entries = max_entries
+        self._sweep_lock = asyncio.Lock()
+        self._sweep_task: Optional[asyncio.Task[None]] = None
+
+    def set_budget(self, max_size_mib: int, max_entries: int) -> None:
+        """Set cache budget and sweep right away."""
+        self._logger.debug("set_budget(): %d MiB, %d images", max_size_mib, max_entries)
+        self._max_bytes = max_size_mib * 1024 * 1024
+        self._max_entries = max_entries
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self.sweep())
+
+    async def run(self) -> None:
+        """Sweep periodically."""
+        await asyncio.sleep(IMAGE_CACHE_SWEEP_DELAY)
+        while True:
+            await self.sweep()
+            await asyncio.sleep(IMAGE_CACHE_SWEEP_INTERVAL)
+
+    async def sweep(self) -> None:
+        """Evict images until the cache fits the budget."""
+        async with self._sweep_lock:
+            app = self._api_manager.app
+
+            # Don't evict anything before the followed channels are known
+            snapshot = app.state.snapshot
+            if snapshot.first_run:
+                return
+
+            keep_user_ids = {c.broadcaster_id for c in snapshot.followed_channels}
+            if snapshot.user is not None:
+                keep_user_ids.add(snapshot.user.id)
+
+            loop = asyncio.get_running_loop()
+            try:
+                evicted = await loop.run_in_executor(
+                    None,
+                    app.image_store.evict,
+                    self._max_bytes,
+                    self._max_entries,
+                    keep_user_ids,
+                )
+            except OSError as exc:
+                self._logger.warning("sweep(): Unable to evict images: %s", exc)
+                return
+
+            if evicted:
+                self._logger.info("sweep(): Evicted %d profile images", evicted)
@@ -0,0 +1,162 @@
+"""Scale downloaded profile images to all icon variants in a process pool."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import gi
+
+gi.require_version("GdkPixbuf", "2.0")
+
+from gi.repository import GdkPixbuf, GLib  # noqa: E402
+
+from twitch_indicator.constants import PROFILE_ICON_SIZES  # noqa: E402
+from twitch_indicator.utils import ImageVariant  # noqa: E402
+
+ScaleResult = dict[ImageVariant, bytes] | str
+
+
+def scale_image(img_data: bytes) -> dict[ImageVariant, bytes]:
+    """Decode profile image once and create PNG data of all icon variants."""
+    loader = GdkPixbuf.PixbufLoader.new()
+    loader.write(img_data)
+    loader.close()
+    pixbuf = loader.get_pixbuf()
+    if pixbuf is None:
+        raise RuntimeError("Failed to get pixbuf")
+
+    images: dict[ImageVariant, bytes] = {}
+    for variant, size in PROFILE_ICON_SIZES.items():
+        pixbuf_icon = pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+        if pixbuf_icon is None:
+            raise RuntimeError(f"Failed to scale pixbuf to {size}px")
+        res, png_data = pixbuf_icon.save_to_bufferv("png", [], [])
+        if not res:
+            raise RuntimeError("Failed to create PNG from pixbuf")
+        images[variant] = png_data
+
+    return images
+
+
+def scale_images(batch: list[bytes]) -> list[ScaleResult]:
+    """Scale batch of images (runs in worker process), errors are returned as message."""
+    results: list[ScaleResult] = []
+    for img_data in batch:
+        try:
+            results.append(scale_image(img_data))
+        except (GLib.Error, RuntimeError) as exc:
+            results.append(str(exc))
+    return results
+
+
+class ImageScaler:
+    """
+    Batch scaling jobs and run them in a process pool.
+
+    Jobs submitted within `BATCH_DELAY` are sent to a worker process together to
+    amortize the inter-process overhead, so a cold cache refresh of hundreds of
+    channels is spread across all cores.
+    """
+
+    BATCH_SIZE = 16
+    BATCH_DELAY = 0.05
+    MAX_WORKERS = 2  # Each worker is a full Python process with GdkPixbuf loaded
+    IDLE_TIMEOUT = 60  # Stop workers after this many seconds without jobs
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._max_workers = max_workers or min(self.MAX_WORKERS, os.cpu_count() or 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queue: list[tuple[bytes, asyncio.Future[dict[ImageVariant, bytes]]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self._running_batches = 0
+
+    async def scale(self, img_data: bytes) -> dict[ImageVariant, bytes]:
+        """Create all icon variants of a profile image."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[dict[ImageVariant, bytes]] = loop.create_future()
+        self._queue.append((img_data, fut))
+
+        if len(self._queue) >= self.BATCH_SIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.BATCH_DELAY, self._flush)
+
+        return await fut
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._shutdown_pool()
+
+    def _shutdown_pool(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _flush(self) -> None:
+        """Send queued jobs to the pool."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        jobs, self._queue = self._queue, []
+        if jobs:
+            asyncio.create_task(self._run_batch(jobs))
+
+    async def _run_batch(
+        self, jobs: list[tuple[bytes, asyncio.Future[dict[ImageVariant, bytes]]]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        self._running_batches += 1
+        try:
+            results = await loop.run_in_executor(
+                self._get_pool(), scale_images, [img_data for img_data, _ in jobs]
+            )
+        except BrokenProcessPool as exc:
+            # Start a new pool for the next batch
+            self._logger.warning("_run_batch(): Worker process died: %s", exc)
+            self._pool = None
+            results = [str(exc)] * len(jobs)
+        except asyncio.CancelledError:
+            for _, fut in jobs:
+                fut.cancel()
+            raise
+        except Exception as exc:
+            # E.g. pool already shut down or job not picklable, don't leave callers waiting
+            self._logger.warning("_run_batch(): Failed to run batch: %s", exc)
+            for _, fut in jobs:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        finally:
+            self._running_batches -= 1
+            if self._running_batches == 0 and self._pool is not None:
+                self._idle_handle = loop.call_later(self.IDLE_TIMEOUT, self._shutdown_pool)
+
+        for (_, fut), result in zip(jobs, results):
+            if fut.done():
+                continue
+            if isinstance(result, str):
+                fut.set_exception(RuntimeError(f"Failed to scale image: {result}"))
+            else:
+                fut.set_result(result)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Don't fork the multithreaded GTK process
+            mp_context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(self._max_workers, mp_context=mp_context)
+        return self._pool
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Generic, Literal, Optional, TypeVar
+from functools import cache
+from typing import TYPE_CHECKING, Any, Generic, Literal, Optional, TypeVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 
 DataT = TypeVar("DataT", bound=BaseModel)
 
@@ -9,9 +10,11 @@ DataT = TypeVar("DataT", bound=BaseModel)
 class ValidationInfo(BaseModel):
     """Twitch API validation info."""
 
+    model_config = ConfigDict(frozen=True)
+
     client_id: str
     login: str
-    scopes: list[str]
+    scopes: tuple[str, ...]
     user_id: int
     expires_in: int
 
@@ -19,6 +22,8 @@ class ValidationInfo(BaseModel):
 class User(BaseModel):
     """Twitch API user info."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     login: str
     display_name: str
@@ -34,6 +39,8 @@ class User(BaseModel):
 class FollowedChannel(BaseModel):
     """Twitch API followed channel."""
 
+    model_config = ConfigDict(frozen=True)
+
     broadcaster_id: int
     broadcaster_login: str
     broadcaster_name: str
@@ -43,6 +50,8 @@ class FollowedChannel(BaseModel):
 class Stream(BaseModel):
     """Twitch API live stream."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     user_id: int
     user_login: str
@@ -55,18 +64,13 @@ class Stream(BaseModel):
     started_at: datetime
     language: str
     thumbnail_url: str
-    tags: Optional[list[str]]  # Might be None contrary to the API doc!
+    tags: Optional[tuple[str, ...]]  # Might be None contrary to the API doc!
 
     @field_validator("game_id", mode="before")
     @classmethod
-    def allow_empty(cls, value: str) -> Optional[int]:
-        """Map empty strings to `None`."""
-        try:
-            return int(value)
-        except ValueError:
-            if value == "":
-                return None
-            raise
+    def allow_empty(cls, value: Any) -> Any:
+        """Map empty strings to `None`, leave integer parsing to the core validator."""
+        return None if value == "" else value
 
 
 class ListData(BaseModel, Generic[DataT]):
@@ -85,3 +89,100 @@ class PaginatedResponse(ListData[DataT], Generic[DataT]):
     """Twitch API paginated data response."""
 
     pagination: Pagination
+
+
+@cache
+def get_list_data_adapter(model: type[DataT]) -> TypeAdapter[ListData[DataT]]:
+    """Get cached validator for list data responses of `model`."""
+    list_model: type[ListData[DataT]]
+    if not TYPE_CHECKING:
+        # Pydantic needs concrete type at runtime, but mypy wouldn't like this
+        list_model = ListData[model]
+    return TypeAdapter(list_model)
+
+
+@cache
+def get_paginated_adapter(model: type[DataT]) -> TypeAdapter[PaginatedResponse[DataT]]:
+    """Get cached validator for paginated responses of `model`."""
+    paginated_model: type[PaginatedResponse[DataT]]
+    if not TYPE_CHECKING:
+        # Pydantic needs concrete type at runtime, but mypy wouldn't like this
+        paginated_model = PaginatedResponse[model]
+    return TypeAdapter(paginated_model)
+
+
+class EventSubSubscription(BaseModel):
+    """Twitch EventSub subscription."""
+
+    id: str
+    type: str
+    version: str
+    status: str
+    condition: dict[str, str]
+    cost: int
+
+
+class EventSubSubscriptionList(ListData[EventSubSubscription]):
+    """Twitch API EventSub subscription response."""
+
+    total: int
+    total_cost: int
+    max_total_cost: int
+
+
+class EventSubSession(BaseModel):
+    """Twitch EventSub WebSocket session."""
+
+    id: str
+    status: str
+    keepalive_timeout_seconds: Optional[int]
+    reconnect_url: Optional[str]
+
+
+class EventSubMetadata(BaseModel):
+    """Twitch EventSub WebSocket message metadata."""
+
+    message_id: str
+    message_type: Literal[
+        "session_welcome",
+        "session_keepalive",
+        "notification",
+        "session_reconnect",
+        "revocation",
+    ]
+    message_timestamp: datetime
+    subscription_type: Optional[str] = None
+
+
+class EventSubPayload(BaseModel):
+    """Twitch EventSub WebSocket message payload."""
+
+    session: Optional[EventSubSession] = None
+    subscription: Optional[EventSubSubscription] = None
+    event: Optional[dict[str, Any]] = None
+
+
+class EventSubMessage(BaseModel):
+    """Twitch EventSub WebSocket message."""
+
+    metadata: EventSubMetadata
+    payload: EventSubPayload
+
+
+class StreamOnlineEvent(BaseModel):
+    """Twitch EventSub stream.online event."""
+
+    id: int
+    broadcaster_user_id: int
+    broadcaster_user_login: str
+    broadcaster_user_name: str
+    type: str
+    started_at: datetime
+
+
+class StreamOfflineEvent(BaseModel):
+    """Twitch EventSub stream.offline event."""
+
+    broadcaster_user_id: int
+    broadcaster_user_login: str
+    broadcaster_user_name: str
@@ -0,0 +1,168 @@
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import aiofiles
+import aiofiles.os
+from pydantic import BaseModel, ValidationError
+
+from twitch_indicator.api.models import Stream
+
+HOURS_PER_WEEK = 7 * 24
+
+
+@dataclass(frozen=True)
+class PollingStats:
+    """Polling cost and notification latency."""
+
+    interval: float  # Seconds between polls right now
+    calls_per_day: Optional[float]  # Poll requests, extrapolated from the last 24h
+    median_latency: Optional[float]  # Seconds from stream start until it was seen
+
+
+class GoLiveHistogram(BaseModel):
+    """Exponentially decayed go-live counts per hour of the week (local time)."""
+
+    user_id: Optional[int] = None  # Logged in user the go-lives were learned for
+    updated_at: float = 0  # Unix timestamp
+    weights: list[float] = [0.0] * HOURS_PER_WEEK
+
+
+class PollScheduler:
+    """
+    Adapt the polling interval to when enabled channels usually go live.
+
+    Go-live times are learned from `started_at` of streams that went live. In
+    hours with more go-lives than average polling speeds up (by up to
+    `MAX_SPEEDUP`), in quiet hours it backs off (by up to `MAX_BACKOFF`).
+    """
+
+    HALF_LIFE = 28 * 24 * 3600  # Older go-lives count less
+    MIN_SAMPLES = 20  # Poll at the configured interval until enough is known
+    MAX_SPEEDUP = 2
+    MAX_BACKOFF = 4
+    MAX_LATENCY = 3600  # Streams found later weren't missed by polling
+    LATENCY_SAMPLES = 100
+    STATS_WINDOW = 24 * 3600
+
+    def __init__(self, path: str, adaptive: bool) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._path = path
+        self.adaptive = adaptive
+        self._histogram = GoLiveHistogram()
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._requests: deque[tuple[float, int]] = deque()  # Monotonic time, count
+        self._started = time.monotonic()
+
+    def adapt_interval(self, interval: float, limits: tuple[float, float]) -> float:
+        """Scale polling interval (seconds) by the go-live likelihood of the next hour."""
+        if not self.adaptive:
+            return interval
+        likelihood = self._likelihood(time.time())
+        if likelihood is None:
+            return interval
+        factor = self.MAX_BACKOFF if likelihood == 0 else 1 / likelihood
+        factor = min(max(factor, 1 / self.MAX_SPEEDUP), self.MAX_BACKOFF)
+        return min(max(interval * factor, limits[0]), limits[1])
+
+    def record_go_live(self, streams: Iterable[Stream], seen_at: float) -> bool:
+        """Learn from streams that went live, returns whether anything was recorded."""
+        recorded = False
+        for stream in streams:
+            started_at = stream.started_at.timestamp()
+            latency = seen_at - started_at
+            if not 0 <= latency <= self.MAX_LATENCY:
+                continue
+            self._latencies.append(latency)
+            self._add_go_live(started_at)
+            recorded = True
+        return recorded
+
+    def record_poll_requests(self, count: int) -> None:
+        """Count requests sent by a poll."""
+        now = time.monotonic()
+        self._requests.append((now, count))
+        while self._requests and self._requests[0][0] < now - self.STATS_WINDOW:
+            self._requests.popleft()
+
+    def stats(self, interval: float) -> PollingStats:
+        """Get polling stats for the current interval."""
+        now = time.monotonic()
+        elapsed = min(now - self._started, self.STATS_WINDOW)
+        calls_per_day = None
+        if self._requests and elapsed >= interval:
+            calls = sum(count for _, count in self._requests)
+            calls_per_day = calls / elapsed * 24 * 3600
+        median_latency = statistics.median(self._latencies) if self._latencies else None
+        return PollingStats(interval, calls_per_day, median_latency)
+
+    def set_user(self, user_id: int) -> None:
+        """Start learning from scratch when a different user logged in."""
+        if self._histogram.user_id not in (None, user_id):
+            self._logger.debug("set_user(): Forgetting go-live times of another user")
+            self._histogram = GoLiveHistogram()
+            self._latencies.clear()
+        if self._histogram.user_id is None:
+            self._histogram = self._histogram.model_copy(update={"user_id": user_id})
+
+    async def load(self) -> None:
+        """Load learned go-live times."""
+        try:
+            async with aiofiles.open(self._path, "r", encoding="UTF-8") as f:
+                histogram = GoLiveHistogram.model_validate_json(await f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValidationError) as exc:
+            self._logger.warning("load(): Ignoring invalid go-live stats: %s", exc)
+            return
+        if len(histogram.weights) == HOURS_PER_WEEK:
+            self._histogram = histogram
+
+    async def save(self) -> None:
+        """Store learned go-live times."""
+        tmp_path = f"{self._path}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "w", encoding="UTF-8") as f:
+                await f.write(self._histogram.model_dump_json())
+            await aiofiles.os.replace(tmp_path, self._path)
+        except OSError as exc:
+            self._logger.warning("save(): Failed to store go-live stats: %s", exc)
+
+    async def clear(self) -> None:
+        """Forget learned go-live times after logout."""
+        self._histogram = GoLiveHistogram()
+        self._latencies.clear()
+        try:
+            await aiofiles.os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            self._logger.warning("clear(): Failed to remove go-live stats: %s", exc)
+
+    def _add_go_live(self, started_at: float) -> None:
+        histogram = self._histogram
+        now = max(time.time(), histogram.updated_at)
+        decay = 0.5 ** ((now - histogram.updated_at) / self.HALF_LIFE)
+        weights = [w * decay for w in histogram.weights]
+        weights[self._hour_of_week(started_at)] += 1
+        self._histogram = GoLiveHistogram(
+            user_id=histogram.user_id, updated_at=now, weights=weights
+        )
+
+    def _likelihood(self, now: float) -> Optional[float]:
+        """Go-live rate of the current and the next hour relative to the average."""
+        weights = self._histogram.weights
+        total = sum(weights)
+        if total < self.MIN_SAMPLES:
+            return None
+        hour = self._hour_of_week(now)
+        upcoming = (weights[hour] + weights[(hour + 1) % HOURS_PER_WEEK]) / 2
+        return upcoming / (total / HOURS_PER_WEEK)
+
+    @staticmethod
+    def _hour_of_week(timestamp: float) -> int:
+        local = time.localtime(timestamp)
+        return local.tm_wday * 24 + local.tm_hour
@@ -0,0 +1,48 @@
+import math
+from enum import StrEnum
+
+from twitch_indicator.constants import (
+    TARGETED_POLL_INTERVAL_MIN,
+    TARGETED_POLL_SPEEDUP,
+    TWITCH_PAGE_SIZE,
+)
+
+
+class PollStrategy(StrEnum):
+    SWEEP = "sweep"  # Paginate all followed live streams
+    TARGETED = "targeted"  # Look up enabled channels only, sweep less often
+
+
+def sweep_cost(live_count: int) -> int:
+    """Requests of a followed live streams sweep."""
+    return max(1, math.ceil(live_count / TWITCH_PAGE_SIZE))
+
+
+def targeted_cost(enabled_count: int) -> int:
+    """Requests of a lookup of the enabled channels."""
+    return math.ceil(enabled_count / TWITCH_PAGE_SIZE)
+
+
+def targeted_interval(poll_interval: float) -> float:
+    """Interval of enabled channel lookups (seconds)."""
+    return max(poll_interval / TARGETED_POLL_SPEEDUP, TARGETED_POLL_INTERVAL_MIN)
+
+
+def choose_poll_strategy(
+    live_count: int, enabled_count: int, poll_interval: float, sweep_interval: float
+) -> PollStrategy:
+    """
+    Pick the strategy with fewer requests per sweep interval.
+
+    Sweeping polls every `poll_interval`. Targeted polling looks up the enabled
+    channels every `targeted_interval()`, plus one sweep per `sweep_interval`.
+    On a tie targeted polling wins, as it notifies faster.
+    """
+    sweeps = sweep_interval / poll_interval
+    if sweeps <= 1 or enabled_count == 0:
+        # Without notifications the menu is all there is to keep fresh
+        return PollStrategy.SWEEP
+    lookups = sweep_interval / targeted_interval(poll_interval)
+    sweeping = sweeps * sweep_cost(live_count)
+    targeted = lookups * targeted_cost(enabled_count) + sweep_cost(live_count)
+    return PollStrategy.TARGETED if targeted <= sweeping else PollStrategy.SWEEP
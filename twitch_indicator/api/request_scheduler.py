@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Mapping, Optional
+
+
+class Priority(IntEnum):
+    """Request priority class, lower values are served first."""
+
+    INTERACTIVE = 0
+    POLL = 1
+    BULK = 2
+
+
+class RequestScheduler:
+    """
+    Schedule API requests within the Helix rate limit budget.
+
+    The budget is taken from the `Ratelimit-*` response headers. Requests are held
+    back until the bucket resets instead of failing, and queued requests are served
+    in priority order.
+
+    https://dev.twitch.tv/docs/api/guide/#twitch-rate-limits
+    """
+
+    MAX_RESET_WAIT = 60
+
+    def __init__(self, max_concurrent: int) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._max_concurrent = max_concurrent
+        self._in_flight = 0
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self.sent: Counter[Priority] = Counter()  # Requests sent per priority
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Remaining requests in current bucket (`None` if unknown)."""
+        return self._remaining
+
+    @property
+    def reset_at(self) -> float:
+        """Bucket reset time (Unix timestamp)."""
+        return self._reset_at
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the rate limit budget is used up."""
+        return self._remaining is not None and self._remaining <= 0
+
+    @property
+    def pending(self) -> int:
+        """Number of queued requests."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    @asynccontextmanager
+    async def request(self, priority: Priority) -> AsyncIterator[None]:
+        """Wait for a request slot and hold it for the duration of the context."""
+        await self._acquire(priority)
+        self.sent[priority] += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._dispatch()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update budget from response headers."""
+        try:
+            limit = int(headers["Ratelimit-Limit"])
+            remaining = int(headers["Ratelimit-Remaining"])
+            reset_at = float(headers["Ratelimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        now = time.time()
+        self._limit = limit
+        self._remaining = remaining
+        # Guard against clock skew
+        self._reset_at = min(max(reset_at, now + 1), now + self.MAX_RESET_WAIT)
+
+        if self.exhausted:
+            msg = "update(): Rate limit budget used up, holding requests for %.1fs"
+            self._logger.info(msg, self._reset_at - now)
+
+    async def _acquire(self, priority: Priority) -> None:
+        """Wait until a request may be sent."""
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        self._dispatch()
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Slot was granted but the request is cancelled
+            if fut.done() and not fut.cancelled():
+                self._in_flight -= 1
+                if self._remaining is not None:
+                    self._remaining += 1
+                self._dispatch()
+            raise
+
+    def _dispatch(self) -> None:
+        """Grant request slots to waiters in priority order."""
+        now = time.time()
+        if self.exhausted and now >= self._reset_at:
+            self._remaining = self._limit
+
+        while self._waiters and self._in_flight < self._max_concurrent:
+            _, _, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.exhausted:
+                break
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            if self._remaining is not None:
+                self._remaining -= 1
+            fut.set_result(None)
+
+        # Wake up when the bucket resets
+        if self._waiters and self.exhausted and self._wakeup is None:
+            delay = max(self._reset_at - now, 0)
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
@@ -0,0 +1,129 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, Optional
+
+from twitch_indicator.api.exceptions import CircuitOpenException
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@dataclass(frozen=True)
+class ApiHealth:
+    """Snapshot of retry and circuit breaker state."""
+
+    circuit_state: CircuitState
+    consecutive_failures: int
+    retries: int
+    retry_at: Optional[float]  # Unix timestamp
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures."""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1, max_delay: float = 30) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+
+    def get_delay(self, attempt: int) -> float:
+        """Get delay before retry number `attempt` (starting at 1)."""
+        self.retries += 1
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests after repeated failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests
+    fail fast. Once the reset timeout has passed, a single probe request is let
+    through. The timeout doubles each time the probe fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        max_reset_timeout: float = 600,
+        on_change: Optional[Callable[["CircuitBreaker"], None]] = None,
+    ) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._on_change = on_change
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    @property
+    def retry_at(self) -> Optional[float]:
+        """Time when requests are let through again (Unix timestamp)."""
+        if self._state == CircuitState.CLOSED:
+            return None
+        remaining = self._opened_at + self._reset_timeout - time.monotonic()
+        return time.time() + max(remaining, 0)
+
+    def check(self) -> None:
+        """Raise `CircuitOpenException` if requests are suspended."""
+        now = time.monotonic()
+
+        if self._state == CircuitState.OPEN:
+            if now < self._opened_at + self._reset_timeout:
+                raise CircuitOpenException
+            self._set_state(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.HALF_OPEN:
+            # Only one probe request at a time (unless the probe got lost)
+            probe_started_at = self._probe_started_at
+            if probe_started_at is not None and now < probe_started_at + self._reset_timeout:
+                raise CircuitOpenException
+            self._probe_started_at = now
+
+    def record_success(self) -> None:
+        """Record a request that reached the server."""
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+        self._probe_started_at = None
+        if self._state != CircuitState.CLOSED:
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self._failures += 1
+        self._probe_started_at = None
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+            self._open()
+        elif self._state == CircuitState.CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._logger.info("_set_state(): Circuit %s -> %s", self._state, state)
+        self._state = state
+        if self._on_change is not None:
+            self._on_change(self)
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from twitch_indicator.api.exceptions import ApiException
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Timing of a stage relative to the start of the graph run (in seconds)."""
+
+    started: float
+    finished: float
+    failed: bool
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+class TaskGraph:
+    """
+    Run async stages concurrently, each one as soon as its dependencies finished.
+
+    Dependencies only order stages. A stage that fails with an `ApiException` is
+    logged and its dependents still run (polling will catch up), any other
+    exception is raised by `run()` after all stages are done.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._name = name
+        self._stages: dict[str, tuple[Callable[[], Awaitable[None]], tuple[str, ...]]] = {}
+
+    def add(
+        self, name: str, func: Callable[[], Awaitable[None]], depends_on: tuple[str, ...] = ()
+    ) -> None:
+        """Add stage, dependencies must be added first."""
+        for dep in depends_on:
+            if dep not in self._stages:
+                raise ValueError(f"Unknown dependency {dep!r} of stage {name!r}")
+        self._stages[name] = (func, depends_on)
+
+    async def run(self) -> dict[str, StageTiming]:
+        """Run all stages, returns per-stage timings."""
+        start = time.perf_counter()
+        timings: dict[str, StageTiming] = {}
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run_stage(name: str) -> None:
+            func, depends_on = self._stages[name]
+            if depends_on:
+                await asyncio.wait([tasks[dep] for dep in depends_on])
+            started = time.perf_counter() - start
+            failed = True
+            try:
+                await func()
+                failed = False
+            except ApiException as exc:
+                self._logger.warning("run(): %s: Stage %s failed: %s", self._name, name, exc)
+            finally:
+                timings[name] = StageTiming(started, time.perf_counter() - start, failed)
+
+        for name in self._stages:
+            tasks[name] = asyncio.create_task(run_stage(name))
+
+        # Cancelling the graph cancels all stages
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self._log_timings(timings, time.perf_counter() - start)
+
+        exceptions = [r for r in results if isinstance(r, BaseException)]
+        if exceptions:
+            raise exceptions[0]
+        return timings
+
+    def _log_timings(self, timings: dict[str, StageTiming], total: float) -> None:
+        for name, timing in sorted(timings.items(), key=lambda item: item[1].finished):
+            self._logger.debug(
+                "run(): %s: %-20s %7.0fms (%4.0f-%4.0fms)%s",
+                self._name,
+                name,
+                timing.duration * 1000,
+                timing.started * 1000,
+                timing.finished * 1000,
+                " failed" if timing.failed else "",
+            )
+        self._logger.info("run(): %s: Finished in %.0fms", self._name, total * 1000)
@@ -1,52 +1,79 @@
 import asyncio
 import logging
 import re
-from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Iterable, Optional, TypeVar
+from email.utils import formatdate
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterable, Optional, TypeVar
 
-import aiofiles
 import aiohttp
-from aiofiles.os import path
-from gi.repository import GdkPixbuf, GLib
-from pydantic import BaseModel
+from gi.repository import GLib
+from pydantic import BaseModel, ValidationError
 
 from twitch_indicator.api.exceptions import (
+    ApiException,
+    ConflictException,
+    InvalidResponseException,
     NotAuthorizedException,
     RateLimitExceededException,
+    ServerErrorException,
 )
+from twitch_indicator.api.image_scaler import ImageScaler
 from twitch_indicator.api.models import (
+    EventSubSubscription,
+    EventSubSubscriptionList,
     FollowedChannel,
-    ListData,
-    PaginatedResponse,
     Stream,
     User,
     ValidationInfo,
+    get_list_data_adapter,
+    get_paginated_adapter,
 )
+from twitch_indicator.api.request_scheduler import Priority, RequestScheduler
+from twitch_indicator.api.retry import ApiHealth, CircuitBreaker, RetryPolicy
 from twitch_indicator.constants import (
+    PROFILE_IMAGE_MAX_AGE,
+    TWITCH_API_URL,
     TWITCH_AUTH_URL,
     TWITCH_CLIENT_ID,
+    TWITCH_MAX_CONCURRENT_REQUESTS,
     TWITCH_PAGE_SIZE,
+    TWITCH_REQUEST_TIMEOUT,
+    TWITCH_USER_LOOKUP_CONCURRENCY,
 )
-from twitch_indicator.utils import Params, build_api_url, get_cached_image_filename
+from twitch_indicator.utils import ImageVariant, Params, build_api_url
 
 if TYPE_CHECKING:
     from twitch_indicator.api.api_manager import ApiManager
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
 
 
 class TwitchApi:
     """Access Twitch API."""
 
-    def __init__(self, api_manager: "ApiManager") -> None:
+    def __init__(self, api_manager: "ApiManager", image_download_concurrency: int) -> None:
         self._logger = logging.getLogger(__name__)
         self._api_manager = api_manager
         self._session: Optional[aiohttp.ClientSession]
+        self._user_lookup_semaphore = asyncio.Semaphore(TWITCH_USER_LOOKUP_CONCURRENCY)
+        self._image_download_semaphore = asyncio.Semaphore(image_download_concurrency)
+        self._profile_downloads: dict[int, asyncio.Future[bool]] = {}
+        self._auth_event: Optional[asyncio.Event] = None  # Re-auth flow in progress
+        self._timeout = aiohttp.ClientTimeout(total=TWITCH_REQUEST_TIMEOUT)
+        self.scheduler = RequestScheduler(TWITCH_MAX_CONCURRENT_REQUESTS)
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker(on_change=self._on_circuit_change)
+        self.image_scaler = ImageScaler()
 
     def set_session(self, session: aiohttp.ClientSession) -> None:
         """Set client session."""
         self._session = session
 
+    def set_image_download_concurrency(self, image_download_concurrency: int) -> None:
+        """Set maximum number of concurrent profile image downloads."""
+        self._image_download_semaphore = asyncio.Semaphore(image_download_concurrency)
+
     async def close_session(self) -> None:
         """Close client session."""
         if self._session is not None and not self._session.closed:
@@ -61,7 +88,9 @@ class TwitchApi:
         self._logger.debug("validate()")
 
         url = build_api_url("validate", url=TWITCH_AUTH_URL)
-        return ValidationInfo.model_validate_json(await self._get_api_response(url))
+        return await self._get_api_response(
+            url, ValidationInfo.model_validate_json, priority=Priority.INTERACTIVE
+        )
 
     async def fetch_followed_channels(self, user_id: int) -> list[FollowedChannel]:
         """
@@ -72,7 +101,22 @@ class TwitchApi:
         self._logger.debug("fetch_followed_channels()")
 
         params = {"user_id": user_id}
-        return await self._get_paginated_api_response(FollowedChannel, "channels/followed", params)
+        return await self._get_paginated_api_response(
+            FollowedChannel, "channels/followed", params, Priority.INTERACTIVE
+        )
+
+    def iter_followed_channels(self, user_id: int) -> AsyncGenerator[list[FollowedChannel], None]:
+        """
+        Fetch followed channels and yield them page by page.
+
+        https://dev.twitch.tv/docs/api/reference/#get-followed-channels
+        """
+        self._logger.debug("iter_followed_channels()")
+
+        params = {"user_id": user_id}
+        return self._iter_paginated_api_response(
+            FollowedChannel, "channels/followed", params, Priority.INTERACTIVE
+        )
 
     async def fetch_followed_streams(self, user_id: int) -> list[Stream]:
         """
@@ -83,9 +127,99 @@ class TwitchApi:
         self._logger.debug("fetch_followed_streams()")
 
         params = {"user_id": user_id}
-        return await self._get_paginated_api_response(Stream, "streams/followed", params)
+        return await self._get_paginated_api_response(
+            Stream, "streams/followed", params, Priority.POLL
+        )
 
-    async def fetch_users(self, user_ids: list[int]) -> list[User]:
+    def iter_followed_streams(self, user_id: int) -> AsyncGenerator[list[Stream], None]:
+        """
+        Fetch live streams followed by user_id and yield them page by page.
+
+        https://dev.twitch.tv/docs/api/reference/#get-followed-streams
+        """
+        self._logger.debug("iter_followed_streams()")
+
+        params = {"user_id": user_id}
+        return self._iter_paginated_api_response(Stream, "streams/followed", params, Priority.POLL)
+
+    async def fetch_streams(
+        self, user_ids: list[int], api_url: str = TWITCH_API_URL
+    ) -> list[Stream]:
+        """
+        Fetch live streams by user ID.
+
+        https://dev.twitch.tv/docs/api/reference/#get-streams
+        """
+        self._logger.debug("fetch_streams(): %s", user_ids)
+
+        params: Params = {"user_id": user_ids, "type": "live", "first": TWITCH_PAGE_SIZE}
+        url = build_api_url("streams", params, url=api_url)
+        parse = partial(self._parse_list_data_response, Stream)
+        return await self._get_api_response(url, parse, priority=Priority.POLL)
+
+    async def fetch_streams_batched(self, user_ids: Iterable[int]) -> list[Stream]:
+        """Fetch live streams of any number of users in concurrent batches."""
+        self._logger.debug("fetch_streams_batched()")
+
+        user_ids = list(dict.fromkeys(user_ids))
+        batches = (
+            user_ids[idx : idx + TWITCH_PAGE_SIZE]
+            for idx in range(0, len(user_ids), TWITCH_PAGE_SIZE)
+        )
+        results = await asyncio.gather(*(self.fetch_streams(batch) for batch in batches))
+        return [stream for streams in results for stream in streams]
+
+    async def create_eventsub_subscription(
+        self,
+        sub_type: str,
+        condition: dict[str, str],
+        session_id: str,
+        api_url: str = TWITCH_API_URL,
+    ) -> tuple[EventSubSubscription, int, int]:
+        """
+        Subscribe to an EventSub event using WebSocket transport.
+
+        Returns the subscription, the total cost and the maximum total cost.
+
+        https://dev.twitch.tv/docs/api/reference/#create-eventsub-subscription
+        """
+        self._logger.debug("create_eventsub_subscription(): %s %s", sub_type, condition)
+
+        url = build_api_url("eventsub/subscriptions", url=api_url)
+        json = {
+            "type": sub_type,
+            "version": "1",
+            "condition": condition,
+            "transport": {"method": "websocket", "session_id": session_id},
+        }
+        subscriptions = await self._get_api_response(
+            url, EventSubSubscriptionList.model_validate_json, "POST", json, Priority.POLL
+        )
+        return subscriptions.data[0], subscriptions.total_cost, subscriptions.max_total_cost
+
+    async def fetch_eventsub_cost(self, api_url: str = TWITCH_API_URL) -> tuple[int, int]:
+        """
+        Fetch the total cost and the maximum total cost of EventSub subscriptions.
+
+        https://dev.twitch.tv/docs/api/reference/#get-eventsub-subscriptions
+        """
+        self._logger.debug("fetch_eventsub_cost()")
+
+        url = build_api_url("eventsub/subscriptions", url=api_url)
+        subscriptions = await self._get_api_response(
+            url, EventSubSubscriptionList.model_validate_json, priority=Priority.POLL
+        )
+        return subscriptions.total_cost, subscriptions.max_total_cost
+
+    async def ws_connect(self, url: str) -> aiohttp.ClientWebSocketResponse:
+        """Open WebSocket connection."""
+        if self._session is None:
+            raise RuntimeError("No session object")
+        return await self._session.ws_connect(url)
+
+    async def fetch_users(
+        self, user_ids: list[int], priority: Priority = Priority.BULK
+    ) -> list[User]:
         """
         Download user info.
 
@@ -94,116 +228,150 @@ class TwitchApi:
         self._logger.debug("fetch_users(): %s", user_ids)
 
         url = build_api_url("users", {"id": user_ids})
-        return self._parse_list_data_response(User, await self._get_api_response(url))
+        parse = partial(self._parse_list_data_response, User)
+        return await self._get_api_response(url, parse, priority=priority)
 
     async def fetch_profile_pictures(self, all_user_ids: Iterable[int]) -> None:
         """Download profile picture if current one is older than 3 days."""
         self._logger.debug("fetch_profile_pictures()")
 
         # Skip images newer than 3 days
-        user_ids: list[int] = []
-        now = datetime.now(timezone.utc)
-        for user_id in all_user_ids:
-            filename = get_cached_image_filename(user_id)
-            filename_icon = get_cached_image_filename(user_id, "icon")
-            try:
-                # check regular variant
-                mtimestamp = datetime.fromtimestamp(await path.getmtime(filename))
-                mtimestamp = mtimestamp.replace(tzinfo=timezone.utc)
-                if now - mtimestamp > timedelta(days=3):
-                    user_ids.append(user_id)
-
-                # check icon variant
-                if not await path.isfile(filename_icon):
-                    user_ids.append(user_id)
-            except FileNotFoundError:
-                user_ids.append(user_id)
-
-        # Fetch profile image URLs
-        profile_urls: dict[int, str] = {}
-        idx = 0
-        max = TWITCH_PAGE_SIZE
-        while idx < len(user_ids):
-            curr_user_ids = user_ids[idx:max]
-
-            users = await self.fetch_users(curr_user_ids)
-            profile_urls.update((u.id, u.profile_image_url) for u in users)
-
-            idx += len(curr_user_ids)
-            max += TWITCH_PAGE_SIZE
-
-        await asyncio.gather(
-            *(self._process_profile_url(user_id, url) for user_id, url in profile_urls.items())
+        image_store = self._api_manager.app.image_store
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, image_store.load)
+        user_ids = [
+            user_id
+            for user_id in all_user_ids
+            if not image_store.is_fresh(user_id, PROFILE_IMAGE_MAX_AGE)
+        ]
+
+        # Share downloads already in flight
+        downloads: list[asyncio.Future[bool]] = []
+        new_user_ids: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            fut = self._profile_downloads.get(user_id)
+            if fut is None:
+                fut = loop.create_future()
+                fut.add_done_callback(partial(self._on_profile_download_done, user_id))
+                self._profile_downloads[user_id] = fut
+                new_user_ids.append(user_id)
+            downloads.append(fut)
+
+        # Fetch profile image URLs in concurrent batches
+        batches = (
+            new_user_ids[idx : idx + TWITCH_PAGE_SIZE]
+            for idx in range(0, len(new_user_ids), TWITCH_PAGE_SIZE)
         )
+        await asyncio.gather(*(self._process_user_batch(batch) for batch in batches))
+
+        if downloads:
+            await asyncio.wait(downloads)
+
+    async def _process_user_batch(self, user_ids: list[int]) -> None:
+        """Fetch profile image URLs for up to 100 users and download images."""
+        try:
+            try:
+                async with self._user_lookup_semaphore:
+                    users = await self.fetch_users(user_ids)
+            except ApiException as exc:
+                self._logger.warning("_process_user_batch(): Unable to fetch users: %s", exc)
+                return
+
+            await asyncio.gather(
+                *(self._download_profile_image(u.id, u.profile_image_url) for u in users)
+            )
+        finally:
+            # Unblock waiters for users that were not found or failed
+            for user_id in user_ids:
+                fut = self._profile_downloads.get(user_id)
+                if fut is not None and not fut.done():
+                    fut.set_result(False)
+
+    async def _download_profile_image(self, user_id: int, profile_image_url: str) -> None:
+        """Download profile image with bounded concurrency."""
+        result = False
+        try:
+            # URL contains a content hash, unchanged URL means unchanged image
+            image_store = self._api_manager.app.image_store
+            entry = image_store.get(user_id)
+            if entry is not None and entry.complete:
+                if entry.profile_image_url == profile_image_url:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, image_store.touch, user_id, profile_image_url)
+                    result = True
+                    return
+
+            async with self._image_download_semaphore:
+                result = await self._process_profile_url(user_id, profile_image_url)
+        except (aiohttp.ClientError, TimeoutError, RuntimeError, OSError) as exc:
+            msg = "_download_profile_image(): Failed for user_id=%d: %s"
+            self._logger.warning(msg, user_id, exc)
+        finally:
+            fut = self._profile_downloads.get(user_id)
+            if fut is not None and not fut.done():
+                fut.set_result(result)
+
+    def _on_profile_download_done(self, user_id: int, fut: "asyncio.Future[bool]") -> None:
+        """Remove finished download from in-flight downloads."""
+        if self._profile_downloads.get(user_id) is fut:
+            del self._profile_downloads[user_id]
 
     async def _process_profile_url(self, user_id: int, profile_image_url: str) -> bool:
         """Download 150x150px variant profile image."""
         url = re.sub(r"-\d+x\d+", "-150x150", profile_image_url)
         if self._session is None:
             raise RuntimeError("No session object")
-        async with self._session.get(url) as response:
+
+        # Source URL unknown, ask CDN if cached image is still current
+        image_store = self._api_manager.app.image_store
+        loop = asyncio.get_running_loop()
+        headers: dict[str, str] = {}
+        entry = image_store.get(user_id)
+        if entry is not None and entry.complete and entry.profile_image_url is None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            headers["If-Modified-Since"] = entry.last_modified or formatdate(
+                entry.mtime, usegmt=True
+            )
+
+        async with self._session.get(url, headers=headers) as response:
+            if response.status == 304:
+                self._logger.debug("_process_profile_url(): Not modified: %s", url)
+                await loop.run_in_executor(None, image_store.touch, user_id, profile_image_url)
+                return True
             if response.status != 200:
                 msg = f"_process_profile_url: Unable to download profile image: {url}"
                 self._logger.warning(msg)
                 return False
             img_data = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
 
-        # scale image
-        if self._api_manager.loop is not None:
-            icon_img_data = await self._api_manager.loop.run_in_executor(
-                None, self._scale_img, img_data, user_id, url
-            )
+        # Create icon variants
+        images: dict[ImageVariant, bytes] = {"regular": img_data}
+        images.update(await self.image_scaler.scale(img_data))
 
         # Save image
-        filename = get_cached_image_filename(user_id)
-        async with aiofiles.open(filename, "wb") as f:
-            await f.write(img_data)
-            msg = "fetch_profile_pictures(): Saved %s (regular)"
-            self._logger.debug(msg, filename)
-        filename_icon = get_cached_image_filename(user_id, "icon")
-        async with aiofiles.open(filename_icon, "wb") as f:
-            await f.write(icon_img_data)
-            msg = "fetch_profile_pictures(): Saved %s (icon)"
-            self._logger.debug(msg, filename_icon)
+        await loop.run_in_executor(
+            None, image_store.put, user_id, images, profile_image_url, etag, last_modified
+        )
+        self._logger.debug("_process_profile_url(): Saved profile image of %d", user_id)
 
         return True
 
-    def _scale_img(self, img_data: bytes, user_id: int, url: str) -> bytes:
-        """Create PNG icon from profile image."""
-        loader = GdkPixbuf.PixbufLoader.new()
-        # Parse image data
-        if not loader.write(img_data):
-            msg = f"_process_profile_url(): Failed to parse image: url={url} user_id={user_id}"
-            raise RuntimeError(msg)
-        if not loader.close():
-            msg = f"_process_profile_url(): Failed to finalize image loader: url={url} user_id={user_id}"
-            raise RuntimeError(msg)
-        pixbuf = loader.get_pixbuf()
-        if pixbuf is None:
-            msg = f"_process_profile_url(): Failed to get pixbuf: url={url} user_id={user_id}"
-            raise RuntimeError(msg)
-        if not loader.close():
-            self._logger.warning("_process_profile_url(): Failed to close PixbufLoader")
-
-        # create icon variant
-        pixbuf_icon = pixbuf.scale_simple(32, 32, GdkPixbuf.InterpType.BILINEAR)
-        if pixbuf_icon is None:
-            msg = f"_process_profile_url(): Failed to scale pixbuf: url={url} user_id={user_id}"
-            raise RuntimeError()
-
-        # Create PNG data
-        res, png_data = pixbuf_icon.save_to_bufferv("png")
-        if not res:
-            msg = f"_process_profile_url(): Failed to create PNG from pixbuf: url={url} user_id={user_id}"
-            raise RuntimeError(msg)
-
-        return png_data
-
     async def _get_paginated_api_response(
-        self, model: type[ModelT], path: str, params: Params
+        self, model: type[ModelT], path: str, params: Params, priority: Priority
     ) -> list[ModelT]:
         """Perform a series of requests for a paginated endpoint."""
         data: list[ModelT] = []
+        async for page_data in self._iter_paginated_api_response(model, path, params, priority):
+            data += page_data
+        return data
+
+    async def _iter_paginated_api_response(
+        self, model: type[ModelT], path: str, params: Params, priority: Priority
+    ) -> AsyncGenerator[list[ModelT], None]:
+        """Perform a series of requests for a paginated endpoint, yield validated pages."""
         cursor: Optional[str] = None
         req_params: Params = {**params, "first": TWITCH_PAGE_SIZE}
 
@@ -212,74 +380,128 @@ class TwitchApi:
                 req_params = {**req_params, "after": cursor}
 
             url = build_api_url(path, req_params)
-            response_text = await self._get_api_response(url)
-            page_data, cursor = self._parse_paginated_response(model, response_text)
-            data += page_data
+            parse = partial(self._parse_paginated_response, model)
+            page_data, cursor = await self._get_api_response(url, parse, priority=priority)
+            yield page_data
 
             if cursor is None:
-                return data
+                return
 
     async def _get_api_response(
-        self, url: str, method: str = "GET", json: Optional[dict[str, Any]] = None
-    ) -> str:
-        """Perform API request."""
+        self,
+        url: str,
+        parse: Callable[[bytes], T],
+        method: str = "GET",
+        json: Optional[dict[str, Any]] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> T:
+        """
+        Perform API request and parse the response body.
+
+        Connection errors, server errors and invalid responses are retried.
+        """
         if self._session is None:
             raise RuntimeError("No session object")
 
-        attempts = 3
+        auth_attempts = 3
+        auth_attempt = 0
         attempt = 0
-        while attempt < attempts:
+        while auth_attempt < auth_attempts:
+            self.circuit_breaker.check()
             try:
-                self._logger.debug(
-                    f"get_api_response(): Attempt {attempt+1}/{attempts} {method} {url}"
-                )
-                if self._api_manager.auth.token is None:
-                    raise NotAuthorizedException
-                headers = {
-                    "Client-Id": TWITCH_CLIENT_ID,
-                    "Authorization": f"Bearer {self._api_manager.auth.token}",
-                }
-                async with self._session.request(
-                    method, url, json=json, headers=headers
-                ) as response:
-                    if response.status in (200, 202, 204):
-                        return await response.text()
-                    elif response.status == 401:
+                async with self.scheduler.request(priority):
+                    self._logger.debug(
+                        f"get_api_response(): Attempt {attempt+1}/{self.retry_policy.max_attempts}"
+                        f" {method} {url}"
+                    )
+                    if self._api_manager.auth.token is None:
                         raise NotAuthorizedException
-                    elif response.status == 429:
-                        raise RateLimitExceededException
-                    else:
-                        msg = f"Unhandled status code: {response.status}"
-                        raise RuntimeError(msg)
+                    headers = {
+                        "Client-Id": TWITCH_CLIENT_ID,
+                        "Authorization": f"Bearer {self._api_manager.auth.token}",
+                    }
+                    async with self._session.request(
+                        method, url, json=json, headers=headers, timeout=self._timeout
+                    ) as response:
+                        self.scheduler.update(response.headers)
+                        if response.status >= 500:
+                            raise ServerErrorException(f"Server error: {response.status}")
+                        self.circuit_breaker.record_success()
+
+                        if response.status in (200, 202, 204):
+                            data = await response.read()
+                            try:
+                                return parse(data)
+                            except ValidationError as exc:
+                                msg = f"Invalid response: {exc.error_count()} errors"
+                                raise InvalidResponseException(msg) from exc
+                        elif response.status == 401:
+                            raise NotAuthorizedException
+                        elif response.status == 409:
+                            raise ConflictException
+                        elif response.status == 429:
+                            # Not caused by the request budget (e.g. EventSub cost limit)
+                            if not self.scheduler.exhausted:
+                                raise RateLimitExceededException
+                            # Hold request until bucket resets
+                            continue
+                        else:
+                            msg = f"Unhandled status code: {response.status}"
+                            raise ApiException(msg)
             except NotAuthorizedException:
-                self._logger.info("_get_api_response(): Not authorized")
-                GLib.idle_add(self._api_manager.app.logout)
-                auth_event = asyncio.Event()
-                GLib.idle_add(self._api_manager.app.gui_manager.show_auth, auth_event)
-                # Wait for auth flow to finish
-                await auth_event.wait()
-            finally:
+                await self._reauthenticate()
+                auth_attempt += 1
+            except (
+                ServerErrorException,
+                InvalidResponseException,
+                aiohttp.ClientError,
+                TimeoutError,
+            ) as exc:
+                self.circuit_breaker.record_failure()
                 attempt += 1
+                if attempt >= self.retry_policy.max_attempts:
+                    raise ServerErrorException(f"Giving up after {attempt} attempts") from exc
+                delay = self.retry_policy.get_delay(attempt)
+                msg = "_get_api_response(): %s, retrying in %.1fs"
+                self._logger.warning(msg, exc.__class__.__name__, delay)
+                await asyncio.sleep(delay)
+
+        raise ApiException("Unable to query API")
+
+    async def _reauthenticate(self) -> None:
+        """Log out and wait for the auth flow, concurrent requests share one flow."""
+        if self._auth_event is None:
+            self._logger.info("_reauthenticate(): Not authorized")
+            self._auth_event = asyncio.Event()
+            GLib.idle_add(self._api_manager.app.logout, False)
+            GLib.idle_add(self._api_manager.app.gui_manager.show_auth, self._auth_event)
+
+        auth_event = self._auth_event
+        await auth_event.wait()
+        if self._auth_event is auth_event:
+            self._auth_event = None
+
+    @property
+    def health(self) -> ApiHealth:
+        """Current retry and circuit breaker state."""
+        return ApiHealth(
+            circuit_state=self.circuit_breaker.state,
+            consecutive_failures=self.circuit_breaker.consecutive_failures,
+            retries=self.retry_policy.retries,
+            retry_at=self.circuit_breaker.retry_at,
+        )
 
-        raise RuntimeError("Unable to query API")
+    def _on_circuit_change(self, circuit_breaker: CircuitBreaker) -> None:
+        with self._api_manager.app.state.transaction() as txn:
+            txn.set_api_health(self.health)
 
     @staticmethod
-    def _parse_list_data_response(model: type[ModelT], text: str) -> list[ModelT]:
-        list_model: ListData[ModelT]
-        if not TYPE_CHECKING:
-            # Pydantic needs concrete type at runtime, but mypy wouldn't like this
-            list_model = ListData[model]
-
-        return list_model.model_validate_json(text).data
+    def _parse_list_data_response(model: type[ModelT], data: bytes) -> list[ModelT]:
+        return get_list_data_adapter(model).validate_json(data).data
 
     @staticmethod
     def _parse_paginated_response(
-        model: type[ModelT], text: str
+        model: type[ModelT], data: bytes
     ) -> tuple[list[ModelT], str | None]:
-        paginated_model: PaginatedResponse[ModelT]
-        if not TYPE_CHECKING:
-            # Pydantic needs concrete type at runtime, but mypy wouldn't like this
-            paginated_model = PaginatedResponse[model]
-
-        validated_model = paginated_model.model_validate_json(text)
+        validated_model = get_paginated_adapter(model).validate_json(data)
         return validated_model.data, validated_model.pagination.cursor
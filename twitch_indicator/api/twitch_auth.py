@@ -1,5 +1,7 @@
 import asyncio
+import hashlib
 import logging
+import time
 import webbrowser
 from os import chmod
 from random import SystemRandom
@@ -10,18 +12,30 @@ import aiofiles
 import aiofiles.os
 from aiofiles.os import path
 from aiohttp import web
+from pydantic import BaseModel, ValidationError
 
+from twitch_indicator.api.models import ValidationInfo
 from twitch_indicator.constants import (
     AUTH_TOKEN_PATH,
     TWITCH_AUTH_REDIRECT_URI,
     TWITCH_AUTH_SCOPES,
     TWITCH_AUTH_URL,
     TWITCH_CLIENT_ID,
+    TWITCH_VALIDATION_INTERVAL,
     UNICODE_ASCII_CHARACTER_SET,
+    VALIDATION_INFO_PATH,
 )
 from twitch_indicator.utils import build_api_url, get_data_file
 
 
+class CachedValidation(BaseModel):
+    """Last successful token validation."""
+
+    token_hash: str
+    validated_at: float  # Unix timestamp
+    validation_info: ValidationInfo
+
+
 class Auth:
     """
     Handle API authentication using implicit grant flow.
@@ -121,10 +135,11 @@ class Auth:
     async def logout(self) -> None:
         """Log out user."""
         self.token = None
-        try:
-            await aiofiles.os.unlink(AUTH_TOKEN_PATH)
-        except FileNotFoundError:
-            pass
+        for filepath in (AUTH_TOKEN_PATH, VALIDATION_INFO_PATH):
+            try:
+                await aiofiles.os.unlink(filepath)
+            except FileNotFoundError:
+                pass
 
     async def restore_token(self) -> None:
         """Restore auth token from config dir."""
@@ -132,12 +147,54 @@ class Auth:
             async with aiofiles.open(AUTH_TOKEN_PATH, "r", encoding="UTF-8") as f:
                 self.token = await f.read()
 
+    async def restore_validation(self) -> Optional[tuple[ValidationInfo, float]]:
+        """
+        Get last validation of the current token if it's recent enough to be trusted.
+
+        Returns validation info and time of validation.
+        """
+        if self.token is None or not await path.isfile(VALIDATION_INFO_PATH):
+            return None
+
+        try:
+            async with aiofiles.open(VALIDATION_INFO_PATH, "r", encoding="UTF-8") as f:
+                cached = CachedValidation.model_validate_json(await f.read())
+        except (OSError, ValidationError) as exc:
+            self._logger.warning("restore_validation(): Ignoring cached validation: %s", exc)
+            return None
+
+        age = time.time() - cached.validated_at
+        if (
+            cached.token_hash != self._hash_token(self.token)
+            or not 0 <= age < TWITCH_VALIDATION_INTERVAL
+            or age >= cached.validation_info.expires_in
+        ):
+            return None
+        return cached.validation_info, cached.validated_at
+
+    async def store_validation(self, validation_info: ValidationInfo, validated_at: float) -> None:
+        """Store validation of the current token."""
+        if self.token is None:
+            return
+        cached = CachedValidation(
+            token_hash=self._hash_token(self.token),
+            validated_at=validated_at,
+            validation_info=validation_info,
+        )
+        async with aiofiles.open(VALIDATION_INFO_PATH, "w", encoding="UTF-8") as f:
+            await f.write(cached.model_dump_json())
+        chmod(VALIDATION_INFO_PATH, 0o600)
+
     async def _store_token(self, token: str) -> None:
         """Store auth token to config dir."""
         async with aiofiles.open(AUTH_TOKEN_PATH, "w", encoding="UTF-8") as f:
             await f.write(token)
         chmod(AUTH_TOKEN_PATH, 0o600)
 
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
     @staticmethod
     def _build_auth_url() -> tuple[str, str]:
         rand = SystemRandom()
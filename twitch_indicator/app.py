@@ -7,10 +7,20 @@ from gi.repository import Gio, Gtk
 
 from twitch_indicator.actions import Actions
 from twitch_indicator.api.api_manager import ApiManager
-from twitch_indicator.constants import APP_ID, CACHE_DIR, CONFIG_DIR
+from twitch_indicator.constants import (
+    APP_ID,
+    CACHE_DIR,
+    CONFIG_DIR,
+    PIXBUF_CACHE_MAX_BYTES,
+    WARM_START_PATH,
+)
+from twitch_indicator.event_loop import install_glib_event_loop_policy
 from twitch_indicator.gui.gui_manager import GuiManager
+from twitch_indicator.gui.pixbuf_cache import PixbufCache
+from twitch_indicator.image_store import ProfileImageStore
 from twitch_indicator.settings import Settings
 from twitch_indicator.state import State
+from twitch_indicator.warm_start import WarmStartCache
 
 debug: bool = os.environ.get("TWITCH_INDICATOR_DEBUG", "false") == "true"
 logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
@@ -30,10 +40,26 @@ class TwitchIndicatorApp(Gtk.Application):
         self.actions: Actions = Actions(self)
         self.settings: Settings = Settings(self)
         self.state: State = State(self)
+        self.image_store: ProfileImageStore = ProfileImageStore(
+            CACHE_DIR, on_change=self._on_profile_image_changed
+        )
+        self.pixbuf_cache: PixbufCache = PixbufCache(self.image_store, PIXBUF_CACHE_MAX_BYTES)
+        self.warm_start: WarmStartCache = WarmStartCache(WARM_START_PATH)
         self.settings.setup_event_handlers()
         self.gui_manager: GuiManager = GuiManager(self)
+        snapshot = self.settings.snapshot
+
+        # The policy must be set before the app is run
+        glib_event_loop = snapshot.glib_event_loop and install_glib_event_loop_policy()
         self.api_manager: ApiManager = ApiManager(
-            self, self.settings.get_double("refresh-interval")
+            self,
+            snapshot.refresh_interval,
+            snapshot.enable_eventsub,
+            snapshot.image_download_concurrency,
+            snapshot.image_cache_max_size,
+            snapshot.image_cache_max_entries,
+            snapshot.adaptive_polling,
+            glib_event_loop,
         )
 
     def do_startup(self) -> None:
@@ -41,6 +67,7 @@ class TwitchIndicatorApp(Gtk.Application):
         self._logger.debug("do_startup()")
         Gtk.Application.do_startup(self)
         self._ensure_dirs()
+        self._restore_warm_start()
         self.api_manager.run()
         self.gui_manager.run()
 
@@ -50,28 +77,35 @@ class TwitchIndicatorApp(Gtk.Application):
     def quit(self) -> None:
         """Close the indicator."""
         self._logger.debug("quit()")
-        self.api_manager.quit()
-        self.gui_manager.quit()
+        self.api_manager.quit(self._on_api_stopped)
 
     def login(self, auth_event: Optional[asyncio.Event] = None) -> None:
         """Start auth flow."""
-        if self.api_manager.loop is not None:
-            # Acquire token
-            coro = self.api_manager.login(auth_event)
-            fut = asyncio.run_coroutine_threadsafe(coro, self.api_manager.loop)
-            try:
-                fut.result()
-            except Exception as exc:
-                self._logger.exception("start_auth(): Exception raised", exc_info=exc)
-                return
-
-    def logout(self) -> None:
-        """Log out user."""
+        self.api_manager.submit(self.api_manager.login(auth_event))
+
+    def logout(self, forget_user: bool = True) -> None:
+        """Log out user, `forget_user` is false when the token just needs to be renewed."""
         self._logger.debug("logout()")
         self.state.reset()
-        if self.api_manager.loop is not None:
-            coro = self.api_manager.auth.logout()
-            asyncio.run_coroutine_threadsafe(coro, self.api_manager.loop)
+        self.api_manager.submit(self.api_manager.logout(forget_user))
+
+    def _on_api_stopped(self) -> None:
+        self.warm_start.save(self.state.snapshot)
+        self.gui_manager.quit()
+        self.image_store.close()
+
+    def _restore_warm_start(self) -> None:
+        """Populate GUI with the state of the last run before any network call."""
+        warm_start = self.warm_start.load()
+        if warm_start is not None:
+            self._logger.debug(
+                "_restore_warm_start(): %d live streams", len(warm_start.live_streams)
+            )
+            self.state.restore(warm_start)
+
+    def _on_profile_image_changed(self, user_id: int) -> None:
+        """Drop outdated decoded images (called from any thread)."""
+        self.pixbuf_cache.invalidate(user_id)
 
     @staticmethod
     def _ensure_dirs() -> None:
@@ -1,7 +1,11 @@
 import os.path
+from typing import TYPE_CHECKING
 
 from gi.repository import GLib
 
+if TYPE_CHECKING:
+    from twitch_indicator.utils import ImageVariant
+
 APP_NAME = "Twitch Indicator"
 VERSION = "1.8"
 
@@ -12,7 +16,22 @@ TWITCH_AUTH_REDIRECT_URI = "http://localhost:17563"
 TWITCH_AUTH_SCOPES = ["user:read:follows"]
 TWITCH_CLIENT_ID = "vrulzk2tm1ozo2c1iv5a14m1ohbill"
 TWITCH_PAGE_SIZE = 100
+TWITCH_MAX_CONCURRENT_REQUESTS = 6
+TWITCH_REQUEST_TIMEOUT = 30
+TWITCH_USER_LOOKUP_CONCURRENCY = 4
 TWITCH_VALIDATION_INTERVAL = 3600  # 1h
+VALIDATION_RETRY_DELAY = 60
+TWITCH_EVENTSUB_WS_URL = os.getenv(
+    "TWITCH_INDICATOR_EVENTSUB_WS_URL", "wss://eventsub.wss.twitch.tv/ws"
+)
+TWITCH_EVENTSUB_API_URL = os.getenv("TWITCH_INDICATOR_EVENTSUB_API_URL", TWITCH_API_URL)
+EVENTSUB_RECONCILE_INTERVAL = 900  # 15min
+LIVE_STREAMS_SWEEP_INTERVAL = 900  # 15min, menu refresh while polling enabled channels only
+TARGETED_POLL_SPEEDUP = 2  # Enabled channels are looked up faster than the refresh interval
+TARGETED_POLL_INTERVAL_MIN = 15
+STATE_COMMIT_DELAY = 0.05  # Coalesce state updates from the API thread
+FOLLOWED_CHANNELS_REFRESH_INTERVAL = 1800  # 30min, only fetches new follows
+FOLLOWED_CHANNELS_FULL_SYNC_INTERVAL = 24 * 3600  # 1d, also catches unfollows
 
 APP_ID = "org.buzz.twitch-indicator"
 SETTINGS_KEY = "apps.twitch-indicator"
@@ -22,6 +41,22 @@ CACHE_DIR = os.path.join(
     os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "twitch-indicator"
 )
 AUTH_TOKEN_PATH = os.path.join(CONFIG_DIR, "authtoken")
+VALIDATION_INFO_PATH = os.path.join(CONFIG_DIR, "validation.json")
+WARM_START_PATH = os.path.join(CACHE_DIR, "state.json.gz")
+FOLLOWED_CHANNELS_PATH = os.path.join(CACHE_DIR, "followed_channels.json")
+GO_LIVE_STATS_PATH = os.path.join(CACHE_DIR, "go_live_stats.json")
+PROFILE_IMAGE_MANIFEST_PATH = os.path.join(CACHE_DIR, "profile_images.json")  # Legacy
+PROFILE_IMAGE_MAX_AGE = 3 * 24 * 3600  # 3 days
+PROFILE_ICON_SIZES: dict["ImageVariant", int] = {
+    "icon": 32,
+    "icon_hidpi": 64,
+}  # Regular variant is 150x150px
+PIXBUF_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 16 MiB
+IMAGE_CACHE_SWEEP_DELAY = 300  # 5min
+IMAGE_CACHE_SWEEP_INTERVAL = 6 * 3600  # 6h
+NOTIFICATION_RETENTION = 3600  # 1h
+NOTIFICATION_RETENTION_MAX = 20
+NOTIFICATION_SUMMARY_MAX_LINES = 5
 TWITCH_LOGO_FILENAME = "twitch_logo.png"
 TWITCH_LOGO_ICON_FILENAME = "twitch_logo_icon.png"
 REFRESH_INTERVAL_LIMITS = (0.5, 15)
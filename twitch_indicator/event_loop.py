@@ -0,0 +1,23 @@
+"""Drive the asyncio API loop from the GLib main context instead of a separate thread."""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def install_glib_event_loop_policy() -> bool:
+    """
+    Integrate asyncio with the GLib main context.
+
+    Needs PyGObject >= 3.50, must be called before the app is run.
+    """
+    try:
+        from gi.events import GLibEventLoopPolicy  # type: ignore[import-not-found]
+    except ImportError:
+        logger.warning("install_glib_event_loop_policy(): Not supported by PyGObject")
+        return False
+
+    asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    logger.debug("install_glib_event_loop_policy(): Installed")
+    return True
@@ -1,22 +1,41 @@
 from gi.repository import GdkPixbuf, GLib
 
 from twitch_indicator.constants import (
+    PROFILE_ICON_SIZES,
     TWITCH_LOGO_FILENAME,
     TWITCH_LOGO_ICON_FILENAME,
 )
-from twitch_indicator.utils import ImageVariant, get_cached_image_filename, get_data_file
+from twitch_indicator.image_store import ProfileImageStore
+from twitch_indicator.utils import ImageVariant, get_data_file
 
 
 class CachedProfileImage(GdkPixbuf.Pixbuf):
     """Cached channel profile image."""
 
+    _app_images: dict[ImageVariant, GdkPixbuf.Pixbuf] = {}
+
+    @classmethod
+    def new_from_cached(
+        cls, image_store: ProfileImageStore, user_id: int, variant: ImageVariant = "regular"
+    ) -> GdkPixbuf.Pixbuf:
+        """Create pixbuf from image store."""
+        img_data = image_store.read(user_id, variant)
+        if img_data is None:
+            return cls.new_app_image(variant)
+        return cls.new_from_image_data(img_data, variant)
+
     @classmethod
-    def new_from_cached(cls, user_id: int, variant: ImageVariant = "regular") -> GdkPixbuf.Pixbuf:
-        """Create pixbuf from disk cache."""
+    def new_from_image_data(
+        cls, img_data: bytes, variant: ImageVariant = "regular"
+    ) -> GdkPixbuf.Pixbuf:
+        """Create pixbuf from encoded image data."""
+        loader = GdkPixbuf.PixbufLoader.new()
         try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(get_cached_image_filename(user_id, variant))
+            loader.write(img_data)
+            loader.close()
+            pixbuf = loader.get_pixbuf()
         except GLib.Error:
-            pixbuf = cls.new_app_image()
+            pixbuf = cls.new_app_image(variant)
 
         if pixbuf is None:
             raise RuntimeError("Could not load pixbuf")
@@ -25,13 +44,23 @@ class CachedProfileImage(GdkPixbuf.Pixbuf):
 
     @classmethod
     def new_app_image(cls, variant: ImageVariant = "regular") -> GdkPixbuf.Pixbuf:
-        """Create fallback app image."""
-        filepath = get_data_file(
-            TWITCH_LOGO_FILENAME if variant == "regular" else TWITCH_LOGO_ICON_FILENAME
-        )
-        pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(filepath))
+        """Create fallback app image (loaded only once)."""
+        pixbuf = cls._app_images.get(variant)
+        if pixbuf is not None:
+            return pixbuf
+
+        if variant == "icon":
+            filepath = get_data_file(TWITCH_LOGO_ICON_FILENAME)
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(filepath))
+        else:
+            filepath = get_data_file(TWITCH_LOGO_FILENAME)
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(filepath))
+            size = PROFILE_ICON_SIZES.get(variant)
+            if pixbuf is not None and size is not None:
+                pixbuf = pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
 
         if pixbuf is None:
             raise RuntimeError("Could not load pixbuf")
 
+        cls._app_images[variant] = pixbuf
         return pixbuf
@@ -75,22 +75,21 @@ class ChannelChooserDialog(BaseDialog[Gtk.Dialog]):
 
     def _add_model_data(self) -> None:
         """Copy data from app state to local model."""
-        with self._gui_manager.app.state.locks["enabled_channel_ids"]:
-            with self._gui_manager.app.state.locks["followed_channels"]:
-                ec_ids = self._gui_manager.app.state.enabled_channel_ids
-                for channel in self._gui_manager.app.state.followed_channels:
-                    enab = ec_ids.get(channel.broadcaster_id, ChannelState.DISABLED)
-                    row = (
-                        channel.broadcaster_name,
-                        ChannelState.ENABLED == enab,
-                        channel.broadcaster_id,
-                    )
-                    self._store.append(row)
+        snapshot = self._gui_manager.app.state.snapshot
+        ec_ids = snapshot.enabled_channel_ids
+        for channel in snapshot.followed_channels:
+            enab = ec_ids.get(channel.broadcaster_id, ChannelState.DISABLED)
+            row = (
+                channel.broadcaster_name,
+                ChannelState.ENABLED == enab,
+                channel.broadcaster_id,
+            )
+            self._store.append(row)
 
     def _commit_model_data(self) -> None:
         """Store channel data in app state."""
         enabled_channel_ids = {
-            cast(str, row[2]): ChannelState.ENABLED if row[1] else ChannelState.DISABLED
+            cast(int, row[2]): ChannelState.ENABLED if row[1] else ChannelState.DISABLED
             for row in self._store
         }
         self._gui_manager.app.state.set_enabled_channel_ids(enabled_channel_ids)
@@ -27,6 +27,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
         self._switch_show_notifications = cast(
             Gtk.Switch, self._builder.get_object("switch_show_notifications")
         )
+        self._switch_eventsub = cast(Gtk.Switch, self._builder.get_object("switch_eventsub"))
         self._switch_show_game = cast(Gtk.Switch, self._builder.get_object("switch_show_game"))
         self._switch_show_viewer_count = cast(
             Gtk.Switch, self._builder.get_object("switch_show_viewer_count")
@@ -76,15 +77,16 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
     def _setup_events(self) -> None:
         """Setup events."""
         super()._setup_events()
-        self._gui_manager.app.state.add_handler("user", lambda _: self._update_user())
+        self._gui_manager.app.state.add_handler("user", lambda *_: self._update_user())
         self._gui_manager.app.state.add_handler(
-            "followed_channels", lambda _: self._update_btn_channel_chooser()
+            "followed_channels", lambda *_: self._update_btn_channel_chooser()
         )
 
     def _apply_data(self) -> None:
         """Apply settings state to local controls."""
         settings = self._gui_manager.app.settings
         self._switch_show_notifications.set_active(settings.get_boolean("enable-notifications"))
+        self._switch_eventsub.set_active(settings.get_boolean("enable-eventsub"))
         self._switch_show_game.set_active(settings.get_boolean("show-game-playing"))
         self._switch_show_viewer_count.set_active(settings.get_boolean("show-viewer-count"))
         self._switch_show_selected_channels_on_top.set_active(
@@ -110,6 +112,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
         """Commit changes to app state."""
         settings = self._gui_manager.app.settings
         settings.set_boolean("enable-notifications", self._switch_show_notifications.get_active())
+        settings.set_boolean("enable-eventsub", self._switch_eventsub.get_active())
         settings.set_boolean("show-game-playing", self._switch_show_game.get_active())
         settings.set_boolean("show-viewer-count", self._switch_show_viewer_count.get_active())
         settings.set_boolean(
@@ -122,8 +125,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
     def _update_user(self) -> None:
         """Update user info area."""
         self._logger.debug("_update_user()")
-        with self._gui_manager.app.state.locks["user"]:
-            user = self._gui_manager.app.state.user
+        user = self._gui_manager.app.state.snapshot.user
         self._logger.debug(f"_update_user(): {user}")
         if user is None:
             self._image_profile.set_from_pixbuf(CachedProfileImage.new_app_image(variant="icon"))
@@ -131,7 +133,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
             self._label_username.set_markup("<i>Logged Out</i>")
         else:
             self._image_profile.set_from_pixbuf(
-                CachedProfileImage.new_from_cached(user.id, variant="icon")
+                self._gui_manager.app.pixbuf_cache.get(user.id, "icon")
             )
             self._btn_loginout.set_label("Log Out")
             self._label_username.set_markup(f"<b>{user.display_name}</b>")
@@ -144,8 +146,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
 
     def _update_btn_channel_chooser(self, enabled=True) -> None:
         """Enable channel chooser button."""
-        with self._gui_manager.app.state.locks["followed_channels"]:
-            has_followers = bool(self._gui_manager.app.state.followed_channels)
+        has_followers = bool(self._gui_manager.app.state.snapshot.followed_channels)
         self._btn_channel_chooser.set_sensitive(has_followers)
 
     def _update_label_refresh_interval(self, value: float) -> None:
@@ -156,8 +157,7 @@ class SettingsDialog(BaseDialog[Gtk.Dialog]):
 
     def _on_btn_loginout_clicked(self, btn: Gtk.Button) -> None:
         """Log out user."""
-        with self._gui_manager.app.state.locks["user"]:
-            user = self._gui_manager.app.state.user
+        user = self._gui_manager.app.state.snapshot.user
         if user is None:
             GLib.idle_add(self._gui_manager.app.login)
         else:
@@ -1,21 +1,30 @@
-from typing import TYPE_CHECKING, Iterable
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import chain
+from typing import TYPE_CHECKING
 
 from gi.repository import GLib, Gtk, XApp
 
 from twitch_indicator.api.models import Stream
-from twitch_indicator.gui.cached_profile_image import CachedProfileImage
-from twitch_indicator.settings import Settings
-from twitch_indicator.state import ChannelState
-from twitch_indicator.utils import format_viewer_count
+from twitch_indicator.api.retry import CircuitState
+from twitch_indicator.gui.stream_menu_item import StreamMenuItem
+from twitch_indicator.state import StateSnapshot
 
 if TYPE_CHECKING:
     from twitch_indicator.gui.gui_manager import GuiManager
 
 
+# (not selected, negative viewer count, user ID)
+SortKey = tuple[bool, int, int]
+
+
 class Indicator(XApp.StatusIcon):
     """App indicator."""
 
     LOGGED_OUT_TEXT = "Logged out..."
+    MENU_SETTINGS = frozenset(
+        ("show-selected-channels-on-top", "show-game-playing", "show-viewer-count")
+    )
 
     def __init__(self, gui_manager: "GuiManager") -> None:
         super().__init__()
@@ -26,28 +35,30 @@ class Indicator(XApp.StatusIcon):
 
         self._menu_streams = Gtk.Menu()
         self._menu_item_streams = Gtk.MenuItem.new()
+        self._separator = Gtk.SeparatorMenuItem.new()
+        self._menu_streams.append(self._separator)
+        self._stream_items: dict[int, StreamMenuItem] = {}
+        self._sort_keys: dict[int, SortKey] = {}
+        self._order: list[SortKey] = []
+        self._top_ids: frozenset[int] = frozenset()
 
         self._setup_menu()
         self._setup_events()
 
     def _setup_events(self) -> None:
-        self._gui_manager.app.state.add_handler("user", lambda _: self._update_tooltip())
-        self._gui_manager.app.state.add_handler(
-            "validation_info", lambda _: self._update_menu_item_streams()
-        )
-        self._gui_manager.app.state.add_handler(
-            "live_streams", lambda _: self._update_menu_item_streams()
-        )
-        self._gui_manager.app.state.add_handler(
-            "live_streams", lambda _: self._update_streams_menu()
-        )
-        self._gui_manager.app.state.add_handler(
-            "enabled_channel_ids", lambda _: self._update_streams_menu()
+        self._menu_streams.connect("notify::scale-factor", lambda *_: self._update_icon_variant())
+        # API manager is created after the GUI
+        GLib.idle_add(self._update_icon_variant)
+        state = self._gui_manager.app.state
+        state.add_handler(
+            ("user", "api_health", "polling_stats"), lambda _, new, __: self._update_tooltip(new)
         )
-        self._gui_manager.app.settings.settings.connect(
-            "changed::show-selected-channels-on-top",
-            lambda *_: self._update_streams_menu(),
+        state.add_handler(
+            ("validation_info", "live_streams", "stale"),
+            lambda _, new, __: self._update_menu_item_streams(new),
         )
+        state.add_handler(("live_streams_delta", "enabled_channel_ids"), self._on_streams_changed)
+        self._gui_manager.app.settings.add_handler(self._on_settings_changed)
 
     def _setup_menu(self) -> None:
         """Setup menu."""
@@ -83,97 +94,132 @@ class Indicator(XApp.StatusIcon):
         self.set_primary_menu(menu)
         self.set_secondary_menu(menu)
 
-    def _update_tooltip(self):
+    def _on_settings_changed(self, keys: frozenset[str]) -> None:
+        if keys & self.MENU_SETTINGS:
+            self._update_streams_menu(self._gui_manager.app.state.snapshot)
+
+    def _update_icon_variant(self) -> bool:
+        """Tell the API which icon variant to prefetch."""
+        scale = self._menu_streams.get_scale_factor()
+        self._gui_manager.app.api_manager.icon_variant = "icon_hidpi" if scale > 1 else "icon"
+        return GLib.SOURCE_REMOVE
+
+    def _update_tooltip(self, snapshot: StateSnapshot) -> None:
         """Update indicator tooltip text."""
-        state = self._gui_manager.app.state
-        with state.locks["user"]:
-            if state.user is None:
-                tooltip = Indicator.LOGGED_OUT_TEXT
-            else:
-                tooltip = f"User: {state.user.display_name}"
+        if snapshot.user is None:
+            tooltip = Indicator.LOGGED_OUT_TEXT
+        else:
+            tooltip = f"User: {snapshot.user.display_name}"
+        api_health = snapshot.api_health
+        if api_health is not None and api_health.circuit_state != CircuitState.CLOSED:
+            tooltip += "\nTwitch API unavailable"
+            if api_health.retry_at is not None:
+                retry_at = datetime.fromtimestamp(api_health.retry_at).strftime("%X")
+                tooltip += f", retrying at {retry_at}"
+        stats = snapshot.polling_stats
+        if snapshot.user is not None and stats is not None:
+            tooltip += f"\nPolling every {stats.interval / 60:.1f} min"
+            if stats.calls_per_day is not None:
+                tooltip += f", ~{stats.calls_per_day:.0f} requests/day"
+            if stats.median_latency is not None:
+                tooltip += f"\nMedian live notification delay: {stats.median_latency / 60:.1f} min"
         self.set_tooltip_text(tooltip)
 
-    def _update_menu_item_streams(self) -> None:
+    def _update_menu_item_streams(self, snapshot: StateSnapshot) -> None:
         """Update live streams menu item label and tooltip."""
-        state = self._gui_manager.app.state
-
-        with state.locks["validation_info"]:
-            logged_out = state.validation_info is None
-
         label = Indicator.LOGGED_OUT_TEXT
         sensitive = False
 
-        if not logged_out:
-            with state.locks["live_streams"]:
-                stream_count = len(state.live_streams)
+        if snapshot.validation_info is not None:
+            stream_count = len(snapshot.live_streams)
             if stream_count > 0:
                 label = f"Live streams ({stream_count})"
                 sensitive = True
             else:
                 label = "No live streams..."
+            if snapshot.stale:
+                label += " (updating)"
 
         self._menu_item_streams.set_label(label)
         self._menu_item_streams.set_sensitive(sensitive)
 
-    def _update_streams_menu(self) -> None:
-        """Update stream list."""
-        settings = self._gui_manager.app.settings
-        state = self._gui_manager.app.state
-        menu = self._menu_streams
-
-        # Order streams by viewer count
-        with state.locks["live_streams"]:
-            streams = sorted(state.live_streams, key=lambda s: -s.viewer_count)
-
-        # Live streams?
-        if streams:
-            # Clear menu
-            for item in menu.get_children():
-                menu.remove(item)
-
-            # Selected streams to top
-            if settings.get_boolean("show-selected-channels-on-top"):
-                with state.locks["enabled_channel_ids"]:
-                    ec_ids = state.enabled_channel_ids.items()
-                    top_ids = [uid for uid, en in ec_ids if en == ChannelState.ENABLED]
-
-                top_streams = (s for s in streams if s.user_id in top_ids)
-                self._create_stream_menu_item(menu, top_streams, settings)
-
-                menu.append(Gtk.SeparatorMenuItem.new())
-
-                bottom_streams = (s for s in streams if s.user_id not in top_ids)
-                self._create_stream_menu_item(menu, bottom_streams, settings)
-            else:
-                self._create_stream_menu_item(menu, streams, settings)
-
-        self._update_menu_item_streams()
-        menu.show_all()
-
-    @staticmethod
-    def _create_stream_menu_item(
-        menu: Gtk.Menu, streams: Iterable[Stream], settings: Settings
+    def _on_streams_changed(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
     ) -> None:
-        """Create menu item for stream."""
-
-        for stream in streams:
-            menu_item = Gtk.ImageMenuItem()
-            menu_item.set_detailed_action_name(f"menu.open-stream::{stream.user_login}")
-
-            # User profile image icon
-            pixbuf = CachedProfileImage.new_from_cached(stream.user_id, "icon")
-            menu_item.set_image(Gtk.Image.new_from_pixbuf(pixbuf))
-
-            # Label
-            label = Gtk.Label()
-            markup = f"<b>{GLib.markup_escape_text(stream.user_name)}</b>"
-            if settings.get_boolean("show-game-playing") and stream.game_name:
-                markup += f" • {GLib.markup_escape_text(stream.game_name)}"
-            if settings.get_boolean("show-viewer-count"):
-                viewer_count = format_viewer_count(stream.viewer_count)
-                markup += f" (<small>{viewer_count}</small>)"
-            label.set_markup(markup)
-            label.set_halign(Gtk.Align.START)
-            menu_item.add(label)
-
-            menu.append(menu_item)
+        """Apply live stream changes to stream menu items."""
+        if "enabled_channel_ids" in keys:
+            self._update_streams_menu(new)
+            return
+
+        delta = new.live_streams_delta
+        for stream in delta.went_offline:
+            self._remove_stream_item(stream.user_id)
+        for stream in chain(delta.went_live, delta.changed, delta.viewers_changed):
+            self._update_stream_item(stream)
+        self._arrange_stream_items()
+
+    def _update_streams_menu(self, snapshot: StateSnapshot) -> None:
+        """Reconcile all stream menu items after selection or settings changed."""
+
+        # Selected streams to top
+        self._top_ids = frozenset()
+        if self._gui_manager.app.settings.snapshot.show_selected_channels_on_top:
+            self._top_ids = snapshot.enabled_ids
+
+        streams = snapshot.live_streams_by_id
+        for user_id in self._stream_items.keys() - streams.keys():
+            self._remove_stream_item(user_id)
+        for stream in streams.values():
+            self._update_stream_item(stream)
+        self._arrange_stream_items()
+
+    def _remove_stream_item(self, user_id: int) -> None:
+        """Remove menu item of stream that went offline."""
+        item = self._stream_items.pop(user_id, None)
+        if item is not None:
+            del self._order[bisect_left(self._order, self._sort_keys.pop(user_id))]
+            self._menu_streams.remove(item)
+            item.destroy()
+
+    def _update_stream_item(self, stream: Stream) -> None:
+        """Add or update stream menu item, keep order by viewer count."""
+        user_id = stream.user_id
+        sort_key = (user_id not in self._top_ids, -stream.viewer_count, user_id)
+        old_sort_key = self._sort_keys.get(user_id)
+        if sort_key != old_sort_key:
+            if old_sort_key is not None:
+                del self._order[bisect_left(self._order, old_sort_key)]
+            insort(self._order, sort_key)
+            self._sort_keys[user_id] = sort_key
+
+        item = self._stream_items.get(user_id)
+        if item is None:
+            item = StreamMenuItem()
+            self._stream_items[user_id] = item
+            self._menu_streams.append(item)
+            item.show_all()
+        item.update(
+            stream,
+            self._gui_manager.app.settings.snapshot,
+            self._gui_manager.app.pixbuf_cache,
+            self._menu_streams.get_scale_factor(),
+        )
+
+    def _arrange_stream_items(self) -> None:
+        """Move stream menu items into place."""
+        menu = self._menu_streams
+        widgets: list[Gtk.MenuItem] = []
+        show_separator = False
+        for is_bottom, _, user_id in self._order:
+            if is_bottom and self._top_ids and not show_separator:
+                widgets.append(self._separator)
+                show_separator = True
+            widgets.append(self._stream_items[user_id])
+        self._separator.set_visible(show_separator)
+
+        children = menu.get_children()
+        for position, widget in enumerate(widgets):
+            if children[position] is not widget:
+                menu.reorder_child(widget, position)
+                children.remove(widget)
+                children.insert(position, widget)
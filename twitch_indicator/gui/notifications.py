@@ -1,98 +1,194 @@
 import logging
-from copy import deepcopy
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Optional
 
 from gi.repository import GdkPixbuf, GLib, Notify
 
 from twitch_indicator.api.models import Stream
-from twitch_indicator.constants import APP_NAME
+from twitch_indicator.constants import (
+    APP_NAME,
+    NOTIFICATION_RETENTION,
+    NOTIFICATION_RETENTION_MAX,
+    NOTIFICATION_SUMMARY_MAX_LINES,
+)
 from twitch_indicator.gui.cached_profile_image import CachedProfileImage
-from twitch_indicator.state import ChannelState
+from twitch_indicator.state import StateSnapshot
 from twitch_indicator.utils import format_viewer_count
 
 if TYPE_CHECKING:
     from twitch_indicator.gui.gui_manager import GuiManager
 
 
+class NotificationRegistry:
+    """
+    Keep references to shown notifications, so action callbacks keep working.
+
+    Some notification daemons never send the `closed` signal, so entries are
+    dropped after `max_age` seconds and the registry holds at most `max_size`.
+    """
+
+    def __init__(self, max_size: int, max_age: float) -> None:
+        self._max_size = max_size
+        self._max_age = max_age
+        self._notifications: OrderedDict[Notify.Notification, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._notifications)
+
+    def add(self, notification: Notify.Notification) -> None:
+        """Register notification, expire old ones."""
+        now = time.monotonic()
+        self._notifications[notification] = now
+        while self._notifications:
+            oldest, added_at = next(iter(self._notifications.items()))
+            if len(self._notifications) <= self._max_size and now - added_at <= self._max_age:
+                break
+            del self._notifications[oldest]
+
+    def remove(self, notification: Notify.Notification) -> None:
+        """Unregister notification."""
+        self._notifications.pop(notification, None)
+
+
 class Notifications:
-    """Keep track of notifications."""
+    """
+    Keep track of notifications.
+
+    Go-live notifications are delivered at most once per `notification-interval`
+    seconds. When more than `notification-burst-threshold` are pending, they are
+    folded into a single summary notification.
+    """
 
     def __init__(self, gui_manager: "GuiManager") -> None:
         self._logger = logging.getLogger(__name__)
         self._gui_manager = gui_manager
-        self._notifications: list[Notify.Notification] = []
-        self._live_stream_user_ids: list[int] = []
+        self._notifications = NotificationRegistry(
+            NOTIFICATION_RETENTION_MAX, NOTIFICATION_RETENTION
+        )
+        self._queue: deque[Stream] = deque()
+        self._delivery_source: Optional[int] = None
+        self._last_delivery = 0.0
 
         Notify.init(APP_NAME)
 
-        self._gui_manager.app.state.add_handler("live_streams", self._update_live_streams)
-
-    def _update_live_streams(self, new_streams: list[Stream]) -> None:
-        """Filter live streams for new streams."""
-        app = self._gui_manager.app
-
-        with app.state.locks["live_streams"]:
-            self._logger.debug("_update_live_streams(): %d streams", len(new_streams))
-
-            # Skip first notification run
-            with app.state.locks["first_run"]:
-                first_run = app.state.first_run
-            if not first_run and app.settings.get_boolean("enable-notifications"):
-                with app.state.locks["enabled_channel_ids"]:
-                    ec_ids = app.state.enabled_channel_ids
-                    notify_list = [
-                        deepcopy(s)
-                        for s in new_streams
-                        # stream wasn't live before?
-                        if s.user_id not in self._live_stream_user_ids
-                        # stream is in enabled list?
-                        and ec_ids.get(s.user_id, ChannelState.DISABLED) == ChannelState.ENABLED
-                    ]
-                GLib.idle_add(self._show_notifications, notify_list)
-
-            self._live_stream_user_ids = [s.user_id for s in new_streams]
-
-    def _show_notifications(self, streams: list[Stream]) -> None:
-        """Show notification for streams, passed as a list of dictionaries."""
-        self._logger.debug("_show_notifications(): notify %d streams", len(streams))
-
-        settings = self._gui_manager.app.settings
-        for stream in streams:
-            show_game_playing = settings.get_boolean("show-game-playing")
-            show_viewer_count = settings.get_boolean("show-viewer-count")
-
-            msg = f"{stream.user_name} just went LIVE!"
-            descr = f"{stream.title}"
-
-            if show_game_playing or show_viewer_count:
-                descr += "\n"
-                if show_game_playing:
-                    descr += f"\nPlaying: <b>{stream.game_name}</b>"
-                if show_viewer_count:
-                    viewer_count = format_viewer_count(stream.viewer_count)
-                    descr += f"\nViewers: <b>{viewer_count}</b>"
-
-            pixbuf = CachedProfileImage.new_from_cached(stream.user_id)
-
-            self._show_notification(msg, descr, stream.user_login, pixbuf)
+        self._gui_manager.app.state.add_handler("live_streams_delta", self._on_live_streams_delta)
+
+    def _on_live_streams_delta(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
+        """Queue notifications for streams that went live."""
+        delta = new.live_streams_delta
+        self._logger.debug("_on_live_streams_delta(): %d went live", len(delta.went_live))
+
+        # Don't announce streams that already ended
+        if delta.went_offline and self._queue:
+            offline_ids = {s.user_id for s in delta.went_offline}
+            self._queue = deque(s for s in self._queue if s.user_id not in offline_ids)
+
+        enable_notifications = self._gui_manager.app.settings.snapshot.enable_notifications
+        if not delta.went_live or not enable_notifications:
+            return
+
+        # Skip first notification run (also when it ended within this commit), except
+        # for streams that went live while the app was closed
+        went_live = delta.went_live
+        if old.first_run or new.first_run:
+            if new.resumed_at is None:
+                return
+            went_live = tuple(s for s in went_live if s.started_at.timestamp() > new.resumed_at)
+
+        # Streams are immutable and can be passed on as they are
+        enabled_ids = new.enabled_ids
+        notify_list = [s for s in went_live if s.user_id in enabled_ids]
+        if notify_list:
+            self._queue.extend(notify_list)
+            self._schedule_delivery()
+
+    def _schedule_delivery(self) -> None:
+        """Deliver next notification when the rate limit allows it."""
+        if self._delivery_source is not None or not self._queue:
+            return
+        interval = self._gui_manager.app.settings.snapshot.notification_interval
+        delay = max(self._last_delivery + interval - time.monotonic(), 0)
+        self._delivery_source = GLib.timeout_add(int(delay * 1000), self._deliver)
+
+    def _deliver(self) -> bool:
+        """Show next notification or a summary of all pending ones."""
+        self._delivery_source = None
+        burst_threshold = self._gui_manager.app.settings.snapshot.notification_burst_threshold
+
+        if len(self._queue) > burst_threshold:
+            streams = list(self._queue)
+            self._queue.clear()
+            self._show_summary(streams)
+        elif self._queue:
+            self._show_stream_notification(self._queue.popleft())
+
+        self._last_delivery = time.monotonic()
+        self._schedule_delivery()
+        return GLib.SOURCE_REMOVE
+
+    def _show_stream_notification(self, stream: Stream) -> None:
+        """Show notification for a stream that went live."""
+        settings = self._gui_manager.app.settings.snapshot
+
+        msg = f"{stream.user_name} just went LIVE!"
+        descr = f"{stream.title}"
+
+        if settings.show_game_playing or settings.show_viewer_count:
+            descr += "\n"
+            if settings.show_game_playing:
+                descr += f"\nPlaying: <b>{stream.game_name}</b>"
+            if settings.show_viewer_count:
+                viewer_count = format_viewer_count(stream.viewer_count)
+                descr += f"\nViewers: <b>{viewer_count}</b>"
+
+        pixbuf = self._gui_manager.app.pixbuf_cache.get(stream.user_id)
+
+        self._show_notification(msg, descr, stream.user_login, pixbuf)
+
+    def _show_summary(self, streams: list[Stream]) -> None:
+        """Show one notification for many streams that went live."""
+        self._logger.debug("_show_summary(): %d streams", len(streams))
+        show_game_playing = self._gui_manager.app.settings.snapshot.show_game_playing
+
+        msg = f"{len(streams)} channels just went LIVE!"
+        lines: list[str] = []
+        for stream in streams[:NOTIFICATION_SUMMARY_MAX_LINES]:
+            line = f"<b>{GLib.markup_escape_text(stream.user_name)}</b>"
+            if show_game_playing and stream.game_name:
+                line += f" • {GLib.markup_escape_text(stream.game_name)}"
+            lines.append(line)
+        if len(streams) > NOTIFICATION_SUMMARY_MAX_LINES:
+            lines.append(f"and {len(streams) - NOTIFICATION_SUMMARY_MAX_LINES} more")
+
+        notification = Notify.Notification.new(msg, "\n".join(lines))
+        notification.set_category("presence.online")
+        notification.set_image_from_pixbuf(CachedProfileImage.new_app_image())
+        self._register(notification)
+        notification.show()
 
     def _show_notification(
         self, msg: str, descr: str, user_login: str, pixbuf: GdkPixbuf.Pixbuf
     ) -> None:
-        """Show notification and store in list."""
+        """Show notification and store in registry."""
         self._logger.debug("_show_notification(): %s: %s", msg, descr)
 
         notification = Notify.Notification.new(msg, descr)
         notification.set_category("presence.online")
 
         # Keep a reference to notifications, otherwise action callback won't work
-        self._notifications.append(notification)
+        self._register(notification)
         notification.add_action("watch", "Watch", self._on_notification_watch, user_login)
-        notification.connect("closed", self._on_closed)
 
         notification.set_image_from_pixbuf(pixbuf)
         notification.show()
 
+    def _register(self, notification: Notify.Notification) -> None:
+        self._notifications.add(notification)
+        notification.connect("closed", self._on_closed)
+
     def _on_closed(self, notification: Notify.Notification) -> None:
         """Called when notification is closed."""
         self._notifications.remove(notification)
@@ -0,0 +1,92 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+from gi.repository import GdkPixbuf
+
+from twitch_indicator.gui.cached_profile_image import CachedProfileImage
+from twitch_indicator.image_store import IMAGE_VARIANTS, ProfileImageStore
+from twitch_indicator.utils import ImageVariant
+
+PixbufKey = tuple[int, ImageVariant]
+
+
+class PixbufCache:
+    """
+    Decoded profile images, least recently used are dropped over the memory budget.
+
+    Lookups on the GTK thread only decode on a miss. The API thread prefetches
+    images before publishing state, and entries are invalidated when the image
+    store is written.
+    """
+
+    def __init__(self, image_store: ProfileImageStore, max_bytes: int) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._image_store = image_store
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pixbufs: OrderedDict[PixbufKey, GdkPixbuf.Pixbuf] = OrderedDict()
+        self._size = 0
+        self._version = 0
+
+    def get(self, user_id: int, variant: ImageVariant = "regular") -> GdkPixbuf.Pixbuf:
+        """Get profile image, decode on cache miss."""
+        key = (user_id, variant)
+        with self._lock:
+            pixbuf = self._pixbufs.get(key)
+            if pixbuf is not None:
+                self._pixbufs.move_to_end(key)
+            version = self._version
+
+        if pixbuf is not None:
+            # Keep the store from evicting images that are only used from memory
+            self._image_store.mark_used(user_id)
+            return pixbuf
+
+        pixbuf = CachedProfileImage.new_from_cached(self._image_store, user_id, variant)
+        self._insert(key, pixbuf, version)
+        return pixbuf
+
+    def prefetch(self, user_ids: Iterable[int], variants: Iterable[ImageVariant]) -> None:
+        """Decode missing images (call from a worker thread)."""
+        variants = tuple(variants)
+        decoded = 0
+        for user_id in user_ids:
+            for variant in variants:
+                key = (user_id, variant)
+                with self._lock:
+                    cached = key in self._pixbufs
+                    version = self._version
+                if cached:
+                    self._image_store.mark_used(user_id)
+                    continue
+                img_data = self._image_store.read(user_id, variant)
+                if img_data is None:
+                    continue
+                pixbuf = CachedProfileImage.new_from_image_data(img_data, variant)
+                self._insert(key, pixbuf, version)
+                decoded += 1
+
+        if decoded:
+            self._logger.debug("prefetch(): Decoded %d images", decoded)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop decoded images of a user."""
+        with self._lock:
+            self._version += 1
+            for variant in IMAGE_VARIANTS:
+                pixbuf = self._pixbufs.pop((user_id, variant), None)
+                if pixbuf is not None:
+                    self._size -= pixbuf.get_byte_length()
+
+    def _insert(self, key: PixbufKey, pixbuf: GdkPixbuf.Pixbuf, version: int) -> None:
+        with self._lock:
+            # Image store was written meanwhile, pixbuf might be outdated
+            if version != self._version or key in self._pixbufs:
+                return
+            self._pixbufs[key] = pixbuf
+            self._size += pixbuf.get_byte_length()
+            while self._size > self._max_bytes and len(self._pixbufs) > 1:
+                _, dropped = self._pixbufs.popitem(last=False)
+                self._size -= dropped.get_byte_length()
@@ -0,0 +1,57 @@
+from typing import Optional
+
+from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
+
+from twitch_indicator.api.models import Stream
+from twitch_indicator.gui.pixbuf_cache import PixbufCache
+from twitch_indicator.settings import SettingsSnapshot
+from twitch_indicator.utils import ImageVariant, format_viewer_count
+
+
+class StreamMenuItem(Gtk.ImageMenuItem):
+    """Menu item for a live stream, only changed parts are updated."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._label = Gtk.Label()
+        self._label.set_halign(Gtk.Align.START)
+        self.add(self._label)
+        self._user_login: Optional[str] = None
+        self._markup: Optional[str] = None
+        self._pixbuf: Optional[GdkPixbuf.Pixbuf] = None
+
+    def update(
+        self,
+        stream: Stream,
+        settings: SettingsSnapshot,
+        pixbuf_cache: PixbufCache,
+        scale: int,
+    ) -> None:
+        """Update action, image and label if changed."""
+        if stream.user_login != self._user_login:
+            self._user_login = stream.user_login
+            self.set_detailed_action_name(f"menu.open-stream::{stream.user_login}")
+
+        # User profile image icon
+        variant: ImageVariant = "icon_hidpi" if scale > 1 else "icon"
+        pixbuf = pixbuf_cache.get(stream.user_id, variant)
+        if pixbuf is not self._pixbuf:
+            self._pixbuf = pixbuf
+            if scale > 1:
+                surface = Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, None)
+                image = Gtk.Image.new_from_surface(surface)
+            else:
+                image = Gtk.Image.new_from_pixbuf(pixbuf)
+            image.show()
+            self.set_image(image)
+
+        # Label
+        markup = f"<b>{GLib.markup_escape_text(stream.user_name)}</b>"
+        if settings.show_game_playing and stream.game_name:
+            markup += f" • {GLib.markup_escape_text(stream.game_name)}"
+        if settings.show_viewer_count:
+            viewer_count = format_viewer_count(stream.viewer_count)
+            markup += f" (<small>{viewer_count}</small>)"
+        if markup != self._markup:
+            self._markup = markup
+            self._label.set_markup(markup)
@@ -0,0 +1,505 @@
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Collection, Mapping, Optional, get_args
+
+from twitch_indicator.constants import PROFILE_IMAGE_MANIFEST_PATH
+from twitch_indicator.utils import ImageVariant, get_cached_image_filename
+
+IMAGE_VARIANTS: tuple[ImageVariant, ...] = get_args(ImageVariant)
+LOOSE_FILE_VARIANTS: tuple[ImageVariant, ...] = ("regular", "icon")  # No HiDPI icon files
+
+# (offset, length, crc32)
+BlobRef = tuple[int, int, int]
+
+
+@dataclass
+class ImageEntry:
+    """Stored profile image variants of a user."""
+
+    mtime: float
+    variants: dict[ImageVariant, BlobRef] = field(default_factory=dict)
+    profile_image_url: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    last_used: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """Whether all variants are stored."""
+        return len(self.variants) == len(IMAGE_VARIANTS)
+
+    @property
+    def size(self) -> int:
+        return sum(length for _, length, _ in self.variants.values())
+
+    def to_record(self, user_id: int) -> dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "mtime": self.mtime,
+            "variants": self.variants,
+            "profile_image_url": self.profile_image_url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "last_used": self.last_used,
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "ImageEntry":
+        return cls(
+            mtime=record["mtime"],
+            variants={k: tuple(v) for k, v in record["variants"].items()},
+            profile_image_url=record.get("profile_image_url"),
+            etag=record.get("etag"),
+            last_modified=record.get("last_modified"),
+            last_used=record.get("last_used", record["mtime"]),
+        )
+
+
+class ProfileImageStore:
+    """
+    Packed profile image store.
+
+    All image variants live in a single append-only data file that is read through
+    a memory map. An append-only JSON lines index maps user IDs to blob offsets. An
+    index record is only appended after its image data was written, so a crash can
+    never leave a record pointing to a truncated image. Superseded blobs are
+    reclaimed by compaction, which writes a new data file and atomically replaces
+    the index.
+
+    Safe to use from the API and the GUI thread.
+    """
+
+    INDEX_FILENAME = "profile_images.idx"
+    INDEX_VERSION = 1
+    COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+
+    def __init__(self, directory: str, on_change: Optional[Callable[[int], None]] = None) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._directory = directory
+        self._on_change = on_change
+        self._index_path = os.path.join(directory, self.INDEX_FILENAME)
+        self._lock = threading.RLock()
+        self._entries: dict[int, ImageEntry] = {}
+        self._loaded = False
+        self._pack_name = ""
+        self._pack_file: Optional[Any] = None
+        self._index_file: Optional[Any] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._index_records = 0
+        self._dead_bytes = 0
+        self._used_user_ids: set[int] = set()
+        # Uses recorded without the store lock, merged before writing last use times
+        self._pending_uses_lock = threading.Lock()
+        self._pending_uses: dict[int, float] = {}
+
+    def load(self) -> None:
+        """Read index (only once)."""
+        with self._lock:
+            self._ensure_loaded()
+
+    def get(self, user_id: int) -> Optional[ImageEntry]:
+        """Get stored image entry."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._entries.get(user_id)
+
+    def is_fresh(self, user_id: int, max_age: float) -> bool:
+        """Whether all variants are stored and younger than `max_age` seconds."""
+        entry = self.get(user_id)
+        if entry is None or not entry.complete:
+            return False
+        return time.time() - entry.mtime <= max_age
+
+    def mark_used(self, user_id: int) -> None:
+        """
+        Refresh last use time of images served from elsewhere (e.g. decoded in memory).
+
+        Doesn't wait for the store lock, safe to call from the GTK thread.
+        """
+        with self._pending_uses_lock:
+            self._pending_uses[user_id] = time.time()
+
+    def read(self, user_id: int, variant: ImageVariant) -> Optional[bytes]:
+        """Read image data, `None` if not stored or corrupt."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(user_id)
+            if entry is None or variant not in entry.variants:
+                return None
+
+            entry.last_used = time.time()
+            self._used_user_ids.add(user_id)
+
+            offset, length, crc = entry.variants[variant]
+            data = self._read_blob(offset, length)
+            if data is None or zlib.crc32(data) != crc:
+                # Drop corrupt images, they will be downloaded again
+                self._logger.warning("read(): Corrupt image data for user_id=%d", user_id)
+                self._dead_bytes += entry.size
+                self._append_record(user_id, ImageEntry(entry.mtime))
+                self._notify_change(user_id)
+                return None
+
+            return data
+
+    def put(
+        self,
+        user_id: int,
+        images: Mapping[ImageVariant, bytes],
+        profile_image_url: Optional[str],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        mtime: Optional[float] = None,
+    ) -> None:
+        """Append image variants and index record."""
+        with self._lock:
+            self._ensure_loaded()
+            pack_file = self._get_pack_file()
+
+            variants: dict[ImageVariant, BlobRef] = {}
+            offset = pack_file.seek(0, os.SEEK_END)
+            for variant, data in images.items():
+                pack_file.write(data)
+                variants[variant] = (offset, len(data), zlib.crc32(data))
+                offset += len(data)
+            pack_file.flush()
+
+            now = time.time()
+            entry = ImageEntry(
+                now if mtime is None else mtime,
+                variants,
+                profile_image_url,
+                etag,
+                last_modified,
+                now,
+            )
+            old_entry = self._entries.get(user_id)
+            if old_entry is not None:
+                self._dead_bytes += old_entry.size
+                entry.last_used = max(old_entry.last_used, now)
+            self._append_record(user_id, entry)
+            self._notify_change(user_id)
+
+            self._maybe_compact()
+
+    def touch(self, user_id: int, profile_image_url: str) -> None:
+        """Mark stored image as fresh without rewriting it."""
+        with self._lock:
+            self._ensure_loaded()
+            old_entry = self._entries.get(user_id)
+            if old_entry is not None:
+                entry = ImageEntry(
+                    time.time(),
+                    old_entry.variants,
+                    profile_image_url,
+                    old_entry.etag,
+                    old_entry.last_modified,
+                    old_entry.last_used,
+                )
+                self._append_record(user_id, entry)
+                self._maybe_compact()
+
+    def compact(self) -> None:
+        """Rewrite data file with live blobs only."""
+        with self._lock:
+            self._ensure_loaded()
+            self._merge_pending_uses()
+            gen = int(self._pack_name.split(".")[1]) + 1 if self._pack_name else 0
+            pack_name = f"profile_images.{gen}.pack"
+            pack_path = os.path.join(self._directory, pack_name)
+            tmp_index_path = f"{self._index_path}.tmp"
+
+            # Write new data file
+            entries: dict[int, ImageEntry] = {}
+            with open(pack_path, "wb") as pack_file:
+                offset = 0
+                for user_id, entry in self._entries.items():
+                    variants: dict[ImageVariant, BlobRef] = {}
+                    for variant, (old_offset, length, crc) in entry.variants.items():
+                        data = self._read_blob(old_offset, length)
+                        if data is None or zlib.crc32(data) != crc:
+                            break
+                        pack_file.write(data)
+                        variants[variant] = (offset, length, crc)
+                        offset += length
+                    else:
+                        entries[user_id] = ImageEntry(
+                            entry.mtime,
+                            variants,
+                            entry.profile_image_url,
+                            entry.etag,
+                            entry.last_modified,
+                            entry.last_used,
+                        )
+                pack_file.flush()
+                os.fsync(pack_file.fileno())
+
+            # Write new index and swap atomically
+            with open(tmp_index_path, "w", encoding="UTF-8") as index_file:
+                index_file.write(self._header_line(pack_name))
+                for user_id, entry in entries.items():
+                    index_file.write(json.dumps(entry.to_record(user_id)) + "\n")
+                index_file.flush()
+                os.fsync(index_file.fileno())
+            os.replace(tmp_index_path, self._index_path)
+
+            old_pack_name = self._pack_name
+            self._close_files()
+            self._entries = entries
+            self._pack_name = pack_name
+            self._index_records = len(entries)
+            self._dead_bytes = 0
+            self._used_user_ids.clear()
+            if old_pack_name:
+                self._remove(os.path.join(self._directory, old_pack_name))
+
+            self._logger.debug("compact(): %d images in %s", len(entries), pack_name)
+
+    def usage(self) -> tuple[int, int]:
+        """Get number of stored bytes and images."""
+        with self._lock:
+            self._ensure_loaded()
+            return sum(entry.size for entry in self._entries.values()), len(self._entries)
+
+    def evict(self, max_bytes: int, max_entries: int, keep_user_ids: Collection[int]) -> int:
+        """
+        Remove least recently used images until the store fits the budget.
+
+        Images of `keep_user_ids` are never removed. Returns number of removed images.
+        """
+        with self._lock:
+            self._ensure_loaded()
+
+            # Persist last use times
+            self._merge_pending_uses()
+            for user_id in self._used_user_ids:
+                entry = self._entries.get(user_id)
+                if entry is not None:
+                    self._append_record(user_id, entry)
+            self._used_user_ids.clear()
+
+            total_bytes, total_entries = self.usage()
+            candidates = sorted(
+                (entry.last_used, user_id)
+                for user_id, entry in self._entries.items()
+                if user_id not in keep_user_ids
+            )
+            evicted = 0
+            for _, user_id in candidates:
+                if total_bytes <= max_bytes and total_entries <= max_entries:
+                    break
+                entry = self._entries.pop(user_id)
+                self._append_deletion(user_id)
+                self._dead_bytes += entry.size
+                total_bytes -= entry.size
+                total_entries -= 1
+                evicted += 1
+                self._notify_change(user_id)
+
+            self._maybe_compact()
+            return evicted
+
+    def close(self) -> None:
+        """Close open files."""
+        with self._lock:
+            self._close_files()
+
+    def _ensure_loaded(self) -> None:
+        """Read index (only once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            with open(self._index_path, "r", encoding="UTF-8") as index_file:
+                lines = index_file.readlines()
+            header = json.loads(lines[0])
+            if header.get("version") != self.INDEX_VERSION:
+                raise ValueError("Unknown index version")
+            self._pack_name = header["pack"]
+        except FileNotFoundError:
+            self.compact()
+            self._remove_stray_packs()
+            self._migrate_loose_files()
+            return
+        except (ValueError, KeyError, IndexError):
+            self._logger.warning("_ensure_loaded(): Corrupt image index, starting over")
+            self._pack_name = ""
+            self.compact()
+            self._remove_stray_packs()
+            return
+
+        pack_path = os.path.join(self._directory, self._pack_name)
+        try:
+            pack_size = os.path.getsize(pack_path)
+        except FileNotFoundError:
+            pack_size = 0
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                user_id = int(record["user_id"])
+                if record.get("deleted"):
+                    self._index_records += 1
+                    self._entries.pop(user_id, None)
+                    continue
+                entry = ImageEntry.from_record(record)
+            except (ValueError, KeyError, TypeError):
+                # Torn last line after a crash
+                continue
+            self._index_records += 1
+            # Skip records pointing beyond the end of the data file
+            if any(offset + length > pack_size for offset, length, _ in entry.variants.values()):
+                continue
+            self._entries[user_id] = entry
+
+        live_bytes = sum(entry.size for entry in self._entries.values())
+        self._dead_bytes = pack_size - live_bytes
+        self._remove_stray_packs()
+
+        msg = "_ensure_loaded(): %d images, %d dead bytes"
+        self._logger.debug(msg, len(self._entries), self._dead_bytes)
+
+    def _migrate_loose_files(self) -> None:
+        """Move images from the former one-file-per-variant cache into the store."""
+        try:
+            names = os.listdir(self._directory)
+        except FileNotFoundError:
+            return
+
+        try:
+            with open(PROFILE_IMAGE_MANIFEST_PATH, "r", encoding="UTF-8") as f:
+                manifest: dict[str, dict[str, Optional[str]]] = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+        user_ids = {int(name) for name in names if name.isdigit()}
+        for user_id in user_ids:
+            filenames: dict[ImageVariant, str] = {
+                variant: get_cached_image_filename(user_id, variant)
+                for variant in LOOSE_FILE_VARIANTS
+            }
+            try:
+                images: dict[ImageVariant, bytes] = {}
+                for variant, filename in filenames.items():
+                    with open(filename, "rb") as f:
+                        images[variant] = f.read()
+                mtime = os.path.getmtime(filenames["regular"])
+            except OSError:
+                pass
+            else:
+                data = manifest.get(str(user_id), {})
+                self.put(
+                    user_id,
+                    images,
+                    data.get("profile_image_url"),
+                    data.get("etag"),
+                    data.get("last_modified"),
+                    mtime,
+                )
+
+            for filename in filenames.values():
+                self._remove(filename)
+
+        self._remove(PROFILE_IMAGE_MANIFEST_PATH)
+        if user_ids:
+            self._logger.info("_migrate_loose_files(): Migrated %d images", len(self._entries))
+
+    def _merge_pending_uses(self) -> None:
+        with self._pending_uses_lock:
+            pending_uses, self._pending_uses = self._pending_uses, {}
+        for user_id, last_used in pending_uses.items():
+            entry = self._entries.get(user_id)
+            if entry is not None and last_used > entry.last_used:
+                entry.last_used = last_used
+                self._used_user_ids.add(user_id)
+
+    def _maybe_compact(self) -> None:
+        live_bytes = sum(entry.size for entry in self._entries.values())
+        dead_data = self._dead_bytes > max(live_bytes, self.COMPACT_MIN_DEAD_BYTES)
+        dead_records = self._index_records > 2 * len(self._entries) + 100
+        if dead_data or dead_records:
+            self.compact()
+
+    def _append_record(self, user_id: int, entry: ImageEntry) -> None:
+        """Append index record, making the entry visible."""
+        if self._index_file is None:
+            self._index_file = open(self._index_path, "a", encoding="UTF-8")
+        self._index_file.write(json.dumps(entry.to_record(user_id)) + "\n")
+        self._index_file.flush()
+        self._index_records += 1
+        self._entries[user_id] = entry
+
+    def _notify_change(self, user_id: int) -> None:
+        if self._on_change is not None:
+            self._on_change(user_id)
+
+    def _append_deletion(self, user_id: int) -> None:
+        """Append index record removing an entry."""
+        if self._index_file is None:
+            self._index_file = open(self._index_path, "a", encoding="UTF-8")
+        self._index_file.write(json.dumps({"user_id": user_id, "deleted": True}) + "\n")
+        self._index_file.flush()
+        self._index_records += 1
+
+    def _read_blob(self, offset: int, length: int) -> Optional[bytes]:
+        """Read from memory-mapped data file, remap if it grew."""
+        end = offset + length
+        if length == 0:
+            return b""
+        if self._mmap is None or end > len(self._mmap):
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            pack_path = os.path.join(self._directory, self._pack_name)
+            try:
+                with open(pack_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size < end:
+                        return None
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError:
+                return None
+        return self._mmap[offset:end]
+
+    def _get_pack_file(self) -> Any:
+        if self._pack_file is None:
+            pack_path = os.path.join(self._directory, self._pack_name)
+            self._pack_file = open(pack_path, "ab")
+        return self._pack_file
+
+    def _close_files(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._pack_file is not None:
+            self._pack_file.close()
+            self._pack_file = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def _remove_stray_packs(self) -> None:
+        """Remove data files left over from an interrupted compaction."""
+        try:
+            names = os.listdir(self._directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.startswith("profile_images.") and name.endswith(".pack"):
+                if name != self._pack_name:
+                    self._remove(os.path.join(self._directory, name))
+
+    def _header_line(self, pack_name: str) -> str:
+        return json.dumps({"version": self.INDEX_VERSION, "pack": pack_name}) + "\n"
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -1,20 +1,62 @@
 import logging
-from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Callable, Optional
 
 from gi.repository import Gio, GLib
 
 from twitch_indicator.constants import SETTINGS_KEY
-from twitch_indicator.state import ChannelState
+from twitch_indicator.state import ChannelState, StateSnapshot
 
 if TYPE_CHECKING:
     from twitch_indicator.app import TwitchIndicatorApp
 
 
+SettingsHandler = Callable[[frozenset[str]], None]
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable copy of all settings, attribute names are keys with underscores."""
+
+    enable_notifications: bool
+    enable_eventsub: bool
+    show_game_playing: bool
+    show_viewer_count: bool
+    show_selected_channels_on_top: bool
+    open_command: str
+    refresh_interval: float
+    adaptive_polling: bool
+    image_download_concurrency: int
+    image_cache_max_size: int
+    image_cache_max_entries: int
+    glib_event_loop: bool
+    notification_interval: float
+    notification_burst_threshold: int
+    enabled_channel_ids: str
+
+    @classmethod
+    def from_settings(cls, settings: Gio.Settings) -> "SettingsSnapshot":
+        values = {
+            f.name: settings.get_value(f.name.replace("_", "-")).unpack() for f in fields(cls)
+        }
+        return cls(**values)
+
+
 class Settings:
     def __init__(self, app: "TwitchIndicatorApp") -> None:
         self._app = app
         self._logger = logging.getLogger(__name__)
         self.settings = Gio.Settings.new(SETTINGS_KEY)
+        self._handlers: list[SettingsHandler] = []
+        self._changed_keys: set[str] = set()
+
+        # Connect before reading, change signals are only emitted for keys that were read
+        self.settings.connect("changed", self._on_changed)
+        self.snapshot = SettingsSnapshot.from_settings(self.settings)
+
+    def add_handler(self, handler: SettingsHandler) -> None:
+        """Call handler with the set of changed keys after settings changed."""
+        self._handlers.append(handler)
 
     def get_enabled_channel_ids(self) -> dict[int, ChannelState]:
         """Get and parse enabled channel IDs from settings."""
@@ -59,17 +101,55 @@ class Settings:
 
     def setup_event_handlers(self) -> None:
         self._app.state.add_handler("enabled_channel_ids", self._set_enabled_channel_ids)
-        self.settings.connect("changed::refresh-interval", self._on_refresh_interval_changed)
+        self.add_handler(self._on_api_settings_changed)
 
-    def _set_enabled_channel_ids(self, enabled_channel_ids: dict[str, ChannelState]) -> None:
+    def _set_enabled_channel_ids(
+        self, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
         """Store serialized enabled channel IDs to settings."""
         enabled_list: list[str] = []
-        with self._app.state.locks["enabled_channel_ids"]:
-            for channel_id, enabled in enabled_channel_ids.items():
-                enabled_list.append(f"{channel_id}:{enabled}")
+        for channel_id, enabled in new.enabled_channel_ids.items():
+            enabled_list.append(f"{channel_id}:{enabled}")
         self.set_string("enabled-channel-ids", ",".join(enabled_list))
 
-    def _on_refresh_interval_changed(self, settings: Gio.Settings, key: str) -> None:
-        if self._app.api_manager.loop is not None:
-            func = self._app.api_manager.update_refresh_interval
-            self._app.api_manager.loop.call_soon_threadsafe(func, self.get_double(key))
+    def _on_changed(self, settings: Gio.Settings, key: str) -> None:
+        """Update snapshot, notify handlers once per main loop iteration."""
+        value = settings.get_value(key).unpack()
+        self.snapshot = replace(self.snapshot, **{key.replace("-", "_"): value})
+        if not self._changed_keys:
+            GLib.idle_add(self._notify_handlers)
+        self._changed_keys.add(key)
+
+    def _notify_handlers(self) -> bool:
+        keys = frozenset(self._changed_keys)
+        self._changed_keys.clear()
+        self._logger.debug("_notify_handlers(): %s", ", ".join(sorted(keys)))
+        for handler in self._handlers:
+            handler(keys)
+        return GLib.SOURCE_REMOVE
+
+    def _on_api_settings_changed(self, keys: frozenset[str]) -> None:
+        """Pass changed settings to API thread."""
+        api_manager = self._app.api_manager
+        if api_manager.loop is None:
+            return
+        snapshot = self.snapshot
+        call = api_manager.loop.call_soon_threadsafe
+
+        if "refresh-interval" in keys:
+            call(api_manager.update_refresh_interval, snapshot.refresh_interval)
+        if "adaptive-polling" in keys:
+            call(api_manager.update_adaptive_polling, snapshot.adaptive_polling)
+        if "enable-eventsub" in keys:
+            call(api_manager.update_eventsub_enabled, snapshot.enable_eventsub)
+        if "image-download-concurrency" in keys:
+            call(
+                api_manager.api.set_image_download_concurrency,
+                snapshot.image_download_concurrency,
+            )
+        if keys & {"image-cache-max-size", "image-cache-max-entries"}:
+            call(
+                api_manager.image_cache_manager.set_budget,
+                snapshot.image_cache_max_size,
+                snapshot.image_cache_max_entries,
+            )
@@ -1,16 +1,24 @@
-import asyncio
 import inspect
+import logging
 import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, Mapping, Optional
+
+from gi.repository import GLib
 
 from twitch_indicator.api.models import FollowedChannel, Stream, User, ValidationInfo
-from twitch_indicator.utils import coro_exception_handler
+from twitch_indicator.api.poll_scheduler import PollingStats
+from twitch_indicator.api.retry import ApiHealth
+from twitch_indicator.constants import STATE_COMMIT_DELAY
+from twitch_indicator.stream_diff import LiveStreamsDelta, diff_live_streams
 
 if TYPE_CHECKING:
     from twitch_indicator.app import TwitchIndicatorApp
-
-Handler = Callable[[Any], None | Coroutine[None, None, None]]
+    from twitch_indicator.warm_start import WarmStart
 
 
 class ChannelState(StrEnum):
@@ -18,78 +26,261 @@ class ChannelState(StrEnum):
     ENABLED = "1"
 
 
-class State:
-    locks: dict[str, threading.Lock] = {
-        "first_run": threading.Lock(),
-        "validation_info": threading.Lock(),
-        "user": threading.Lock(),
-        "followed_channels": threading.Lock(),
-        "live_streams": threading.Lock(),
-        "enabled_channel_ids": threading.Lock(),
-    }
+@dataclass(frozen=True)
+class StateSnapshot:
+    """
+    Immutable view of the app state.
+
+    Every change creates a new snapshot with an incremented version, so readers
+    get a consistent view of all fields without locking.
+    """
+
+    version: int = 0
+    first_run: bool = True
+    validation_info: Optional[ValidationInfo] = None
+    validated_at: Optional[float] = None  # Unix timestamp
+    user: Optional[User] = None
+    followed_channels: tuple[FollowedChannel, ...] = ()
+    live_streams: tuple[Stream, ...] = ()
+    live_streams_by_id: Mapping[int, Stream] = field(default_factory=lambda: MappingProxyType({}))
+    live_streams_delta: LiveStreamsDelta = LiveStreamsDelta()  # Changes of this version
+    live_streams_refreshed_at: Optional[float] = None  # Unix timestamp of last full refresh
+    stale: bool = False  # Restored from the last run, not refreshed yet
+    resumed_at: Optional[float] = None  # Unix timestamp when the last run was saved
+    enabled_channel_ids: Mapping[int, ChannelState] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    api_health: Optional[ApiHealth] = None
+    polling_stats: Optional[PollingStats] = None
+
+    @property
+    def enabled_ids(self) -> frozenset[int]:
+        """IDs of channels with notifications enabled."""
+        ec_ids = self.enabled_channel_ids.items()
+        return frozenset(int(uid) for uid, en in ec_ids if en == ChannelState.ENABLED)
+
+
+# Handlers are called with the old and the new snapshot and the changed keys
+Handler = Callable[
+    [StateSnapshot, StateSnapshot, frozenset[str]], None | Coroutine[None, None, None]
+]
+
+# Maps the current snapshot to changed fields
+Update = Callable[[StateSnapshot], dict[str, Any]]
+
+
+class StateUpdates(ABC):
+    """State setters, subclasses decide when updates are applied."""
+
+    @abstractmethod
+    def _add_update(self, update: Update) -> None:
+        """Apply or collect update."""
+
+    def set_first_run(self, first_run: bool) -> None:
+        self._add_update(lambda _: {"first_run": first_run})
+
+    def set_validation_info(
+        self, validation_info: Optional[ValidationInfo], validated_at: Optional[float] = None
+    ) -> None:
+        if validation_info is None:
+            validated_at = None
+        elif validated_at is None:
+            validated_at = time.time()
+        self._add_update(
+            lambda _: {"validation_info": validation_info, "validated_at": validated_at}
+        )
+
+    def set_user(self, user: Optional[User]) -> None:
+        self._add_update(lambda _: {"user": user})
+
+    def set_followed_channels(self, followed_channels: Iterable[FollowedChannel]) -> None:
+        channels = tuple(followed_channels)
+        self._add_update(lambda _: {"followed_channels": channels})
+
+    def set_live_streams(self, live_streams: Iterable[Stream]) -> None:
+        """Replace live streams, triggers `live_streams_delta` with the changes."""
+        streams_by_id = {s.user_id: s for s in live_streams}
+        refreshed_at = time.time()
+        self._add_update(
+            lambda _: {
+                **_live_streams_changes(streams_by_id),
+                "live_streams_refreshed_at": refreshed_at,
+                "stale": False,
+            }
+        )
+
+    def patch_live_streams(self, streams: list[Stream], removed_user_ids: Iterable[int]) -> None:
+        """Add or update single live streams and remove streams that went offline."""
+        removed = tuple(removed_user_ids)
+
+        def update(snapshot: StateSnapshot) -> dict[str, Any]:
+            streams_by_id = dict(snapshot.live_streams_by_id)
+            for user_id in removed:
+                streams_by_id.pop(user_id, None)
+            streams_by_id.update((s.user_id, s) for s in streams)
+            return _live_streams_changes(streams_by_id)
+
+        self._add_update(update)
+
+    def set_enabled_channel_ids(self, enabled_channel_ids: Mapping[int, ChannelState]) -> None:
+        ec_ids = MappingProxyType(dict(enabled_channel_ids))
+        self._add_update(lambda _: {"enabled_channel_ids": ec_ids})
+
+    def set_api_health(self, api_health: ApiHealth) -> None:
+        self._add_update(lambda _: {"api_health": api_health})
+
+    def set_polling_stats(self, polling_stats: PollingStats) -> None:
+        self._add_update(lambda _: {"polling_stats": polling_stats})
+
+
+class StateTransaction(StateUpdates):
+    """
+    Collect updates and apply them together on the main loop.
+
+    Usable from any thread, updates are posted when the `with` block exits
+    without an exception.
+    """
+
+    def __init__(self, state: "State") -> None:
+        self._state = state
+        self._updates: list[Update] = []
+
+    def __enter__(self) -> "StateTransaction":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def commit(self) -> None:
+        """Post collected updates."""
+        updates, self._updates = self._updates, []
+        self._state.post(updates)
+
+    def _add_update(self, update: Update) -> None:
+        self._updates.append(update)
+
+
+class State(StateUpdates):
+    """
+    App state.
+
+    Setters called on the main loop are applied immediately. Other threads use
+    `transaction()`. Transactions posted in quick succession are coalesced into
+    a single commit, so handlers run once per batch.
+    """
 
     def __init__(self, app: "TwitchIndicatorApp") -> None:
         self._app = app
-        self._handlers: dict[str, list[Handler]] = {}
+        self._logger = logging.getLogger(__name__)
+        self._handlers: list[tuple[frozenset[str], Handler]] = []
 
-        self.first_run = True
-        self.validation_info: Optional[ValidationInfo] = None
-        self.user: Optional[User] = None
-        self.followed_channels: list[FollowedChannel] = []
-        self.live_streams: list[Stream] = []
-        self.enabled_channel_ids = self._app.settings.get_enabled_channel_ids()
+        # Only serializes writers, readers use the current snapshot
+        self._commit_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: list[Update] = []
+
+        enabled_channel_ids = self._app.settings.get_enabled_channel_ids()
+        self.snapshot = StateSnapshot(enabled_channel_ids=MappingProxyType(enabled_channel_ids))
 
     def reset(self):
-        """Reset user state."""
-        self.set_first_run(True)
-        self.set_validation_info(None)
-        self.set_user(None)
-        self.set_followed_channels([])
-        self.set_live_streams([])
+        """Reset user state, after all pending updates."""
+        with self.transaction() as txn:
+            txn.set_first_run(True)
+            txn.set_validation_info(None)
+            txn.set_user(None)
+            txn.set_followed_channels([])
+            txn.set_live_streams([])
+        self.post((lambda _: {"resumed_at": None},))
+        self._commit_pending()
 
-    def set_first_run(self, first_run: bool) -> None:
-        self._set_value("first_run", first_run)
+    def restore(self, warm_start: "WarmStart") -> None:
+        """Show state of the last run until it's refreshed."""
+        streams_by_id = {s.user_id: s for s in warm_start.live_streams}
+        self._add_update(
+            lambda _: {
+                "first_run": True,
+                "validation_info": warm_start.validation_info,
+                "validated_at": warm_start.validated_at,
+                "user": warm_start.user,
+                "followed_channels": warm_start.followed_channels,
+                **_live_streams_changes(streams_by_id),
+                "live_streams_refreshed_at": warm_start.live_streams_refreshed_at,
+                "stale": True,
+                "resumed_at": warm_start.saved_at,
+            }
+        )
 
-    def set_validation_info(self, validation_info: Optional[ValidationInfo]) -> None:
-        self._set_value("validation_info", validation_info)
+    def transaction(self) -> StateTransaction:
+        """Start batch of updates."""
+        return StateTransaction(self)
 
-    def set_user(self, user: Optional[User]) -> None:
-        self._set_value("user", user)
+    def post(self, updates: Iterable[Update]) -> None:
+        """Schedule updates for the next commit (thread-safe)."""
+        with self._pending_lock:
+            schedule = not self._pending
+            self._pending.extend(updates)
+            schedule = schedule and bool(self._pending)
+        if schedule:
+            GLib.timeout_add(int(STATE_COMMIT_DELAY * 1000), self._commit_pending)
+
+    def add_handler(self, names: str | Iterable[str], handler: Handler) -> None:
+        """Register handler, called once per commit that changed any of `names`."""
+        names = frozenset((names,) if isinstance(names, str) else names)
+        self._handlers.append((names, handler))
+
+    def remove_handler(self, handler: Handler) -> None:
+        """Unregister handler."""
+        self._handlers = [(n, h) for n, h in self._handlers if h != handler]
+
+    def _add_update(self, update: Update) -> None:
+        self._commit((update,))
 
-    def set_followed_channels(self, followed_channels: list[FollowedChannel]) -> None:
-        self._set_value("followed_channels", followed_channels)
+    def _commit_pending(self) -> bool:
+        with self._pending_lock:
+            updates, self._pending = self._pending, []
+        self._commit(updates)
+        return GLib.SOURCE_REMOVE
 
-    def set_live_streams(self, live_streams: list[Stream]) -> None:
-        self._set_value("live_streams", live_streams)
+    def _commit(self, updates: Iterable[Update]) -> None:
+        """Apply updates to a new snapshot, swap it in and run handlers."""
+        with self._commit_lock:
+            old = new = self.snapshot
+            keys: set[str] = set()
+            for update in updates:
+                changes = update(new)
+                new = replace(new, **changes)
+                keys.update(changes)
+            if not keys:
+                return
 
-    def set_enabled_channel_ids(self, enabled_channel_ids: dict[str, ChannelState]) -> None:
-        self._set_value("enabled_channel_ids", enabled_channel_ids)
+            # Diff once per commit, no matter how many updates touched live streams
+            delta = LiveStreamsDelta()
+            if "live_streams" in keys:
+                delta = diff_live_streams(old.live_streams_by_id, new.live_streams_by_id)
+                if delta:
+                    keys.add("live_streams_delta")
 
-    def add_handler(self, name: str, handler: Handler) -> None:
-        """Register event handler."""
-        if name in self._handlers:
-            self._handlers[name].append(handler)
+            new = replace(new, version=old.version + 1, live_streams_delta=delta)
+            self.snapshot = new
+
+        changed = frozenset(keys)
+        self._logger.debug("_commit(): Version %d: %s", new.version, ", ".join(sorted(changed)))
+        for names, handler in tuple(self._handlers):
+            if names & changed:
+                self._call_handler(handler, old, new, changed)
+
+    def _call_handler(
+        self, handler: Handler, old: StateSnapshot, new: StateSnapshot, keys: frozenset[str]
+    ) -> None:
+        if inspect.iscoroutinefunction(handler):
+            self._app.api_manager.submit(handler(old, new, keys))
         else:
-            self._handlers[name] = [handler]
-
-    def remove_handler(self, name: str, handler: Handler) -> None:
-        """Unregister event handler."""
-        if name in self._handlers and handler in self._handlers[name]:
-            self._handlers[name].remove(handler)
-
-    def _trigger_event(self, name: str, *args: list[Any], **kwargs: dict[str, Any]) -> None:
-        if name in self._handlers:
-            for handler in self._handlers[name]:
-                if inspect.iscoroutinefunction(handler):
-                    loop = self._app.api_manager.loop
-                    if loop is not None:
-                        coro = handler(*args, **kwargs)
-                        fut = asyncio.run_coroutine_threadsafe(coro, loop)
-                        fut.add_done_callback(coro_exception_handler)
-                else:
-                    handler(*args, **kwargs)
-
-    def _set_value(self, name: str, val: Any) -> None:
-        with self.locks[name]:
-            setattr(self, name, val)
-        self._trigger_event(name, val)
+            handler(old, new, keys)
+
+
+def _live_streams_changes(streams_by_id: dict[int, Stream]) -> dict[str, Any]:
+    return {
+        "live_streams": tuple(streams_by_id.values()),
+        "live_streams_by_id": MappingProxyType(streams_by_id),
+    }
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Mapping
+
+from twitch_indicator.api.models import Stream
+
+
+@dataclass(frozen=True)
+class LiveStreamsDelta:
+    """Difference between two live stream lists."""
+
+    went_live: tuple[Stream, ...] = ()
+    went_offline: tuple[Stream, ...] = ()
+    changed: tuple[Stream, ...] = ()  # Game or title changed
+    viewers_changed: tuple[Stream, ...] = ()  # Only viewer count changed
+
+    def __bool__(self) -> bool:
+        return bool(self.went_live or self.went_offline or self.changed or self.viewers_changed)
+
+
+def diff_live_streams(old: Mapping[int, Stream], new: Mapping[int, Stream]) -> LiveStreamsDelta:
+    """Compare live streams keyed by user ID."""
+    went_live: list[Stream] = []
+    changed: list[Stream] = []
+    viewers_changed: list[Stream] = []
+
+    for user_id, stream in new.items():
+        old_stream = old.get(user_id)
+        if old_stream is None:
+            went_live.append(stream)
+        elif old_stream is stream:
+            continue
+        elif (
+            old_stream.game_id != stream.game_id
+            or old_stream.game_name != stream.game_name
+            or old_stream.title != stream.title
+            or old_stream.user_login != stream.user_login
+            or old_stream.user_name != stream.user_name
+        ):
+            changed.append(stream)
+        elif old_stream.viewer_count != stream.viewer_count:
+            viewers_changed.append(stream)
+
+    went_offline = [stream for user_id, stream in old.items() if user_id not in new]
+
+    return LiveStreamsDelta(
+        tuple(went_live), tuple(went_offline), tuple(changed), tuple(viewers_changed)
+    )
@@ -12,7 +12,7 @@ _ROOT = os.path.abspath(os.path.dirname(__file__))
 
 ParamVal = str | int
 Params = Mapping[str, ParamVal | Sequence[ParamVal]]
-ImageVariant = Literal["regular", "icon"]
+ImageVariant = Literal["regular", "icon", "icon_hidpi"]
 
 
 def get_data_file(filename: str) -> os.PathLike[str]:
@@ -21,7 +21,7 @@ def get_data_file(filename: str) -> os.PathLike[str]:
 
 
 def get_cached_image_filename(user_id: int, variant: ImageVariant = "regular") -> str:
-    """Get cached image file name."""
+    """Get image file name of the former one-file-per-variant cache."""
     append = "" if variant == "regular" else "_icon"
     return os.path.join(CACHE_DIR, f"{user_id}{append}")
 
@@ -0,0 +1,101 @@
+import gzip
+import logging
+import os
+import threading
+import time
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from twitch_indicator.api.models import FollowedChannel, Stream, User, ValidationInfo
+from twitch_indicator.state import StateSnapshot
+
+
+class WarmStart(BaseModel):
+    """State of the last run, shown until it's refreshed."""
+
+    model_config = ConfigDict(frozen=True)
+
+    version: Literal[1] = 1
+    saved_at: float
+    validated_at: float
+    validation_info: ValidationInfo
+    user: Optional[User]
+    followed_channels: tuple[FollowedChannel, ...]
+    live_streams: tuple[Stream, ...]
+    live_streams_refreshed_at: Optional[float]
+
+    @property
+    def expires_at(self) -> float:
+        return self.validated_at + self.validation_info.expires_in
+
+
+class WarmStartCache:
+    """
+    Persist the last state as gzipped JSON.
+
+    Only logged in state is stored, the file is removed after logout.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[WarmStart]:
+        """Load snapshot if the validation it's based on didn't expire."""
+        try:
+            with gzip.open(self._path, "rb") as f:
+                warm_start = WarmStart.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValidationError) as exc:
+            self._logger.warning("load(): Ignoring invalid snapshot: %s", exc)
+            return None
+
+        if warm_start.expires_at <= time.time():
+            self._logger.debug("load(): Validation expired")
+            return None
+        return warm_start
+
+    def save(self, snapshot: StateSnapshot) -> None:
+        """Store snapshot atomically (callable from any thread)."""
+        if snapshot.validation_info is None or snapshot.validated_at is None:
+            self.clear()
+            return
+
+        # Don't move the time of the last real update forward
+        saved_at = snapshot.resumed_at if snapshot.stale else None
+        warm_start = WarmStart(
+            saved_at=saved_at or time.time(),
+            validated_at=snapshot.validated_at,
+            validation_info=snapshot.validation_info,
+            user=snapshot.user,
+            followed_channels=snapshot.followed_channels,
+            live_streams=snapshot.live_streams,
+            live_streams_refreshed_at=snapshot.live_streams_refreshed_at,
+        )
+        data = gzip.compress(warm_start.model_dump_json().encode(), mtime=0)
+
+        tmp_path = f"{self._path}.tmp"
+        with self._lock:
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path)
+            except OSError as exc:
+                self._logger.warning("save(): Failed to store snapshot: %s", exc)
+                return
+        self._logger.debug(
+            "save(): Stored %d live streams, %d bytes", len(snapshot.live_streams), len(data)
+        )
+
+    def clear(self) -> None:
+        """Remove stored snapshot."""
+        with self._lock:
+            try:
+                os.remove(self._path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                self._logger.warning("clear(): Failed to remove snapshot: %s", exc)